@@ -0,0 +1,29 @@
+from typing import Dict, List
+
+import log
+
+
+RESULTS: List[Dict] = []
+
+
+def pytest_configure():
+    """Disable verbose output when running benchmarks."""
+    log.init(debug=True)
+    log.silence('elections', 'parse', 'pomace', allow_warning=True)
+    log.silence('asyncio', 'factory', 'faker', 'selenium', 'urllib3', 'vcr')
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Show the query counts and memory recorded alongside each timing."""
+    if not RESULTS:
+        return
+
+    terminalreporter.section("queries and peak memory")
+    terminalreporter.write_line(
+        f'{"Stage":<10} {"Ballot":<40} {"Queries":>8} {"Peak":>10}'
+    )
+    for result in RESULTS:
+        terminalreporter.write_line(
+            f'{result["stage"]:<10} {result["ballot"]:<40} '
+            f'{result["queries"]:>8} {result["peak_memory"] / 1024:>7.0f} KB'
+        )
@@ -0,0 +1,125 @@
+# pylint: disable=redefined-outer-name
+
+"""
+Replay recorded MVIC ballots through each stage of the scrape and parse pipeline.
+
+Each stage is timed over several rounds once the earlier stages have run. One
+extra run per stage records its query count and peak memory, which are saved
+as extra info with the timings and summarized at the end of the run.
+"""
+
+import re
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from elections import defaults
+from elections.models import BallotWebsite
+
+from .conftest import RESULTS
+
+
+CASSETTES = Path(__file__).parents[1] / 'tests' / 'cassettes'
+
+ELECTIONS = {
+    'test_2020_primary_ballots': 682,
+    'test_2020_general_ballots': 683,
+    'test_2021_consolidated_ballots': 685,
+    'test_2021_primary_ballots': 686,
+}
+
+STAGES = ['validate', 'scrape', 'convert', 'parse']
+
+ROUNDS = 5
+
+
+def find_ballots() -> Iterator:
+    for path in sorted(CASSETTES.glob('*.yaml')):
+        match = re.fullmatch(r'(\w+)\[(\d+)-\d+\]', path.stem)
+        if match and match[1] in ELECTIONS:
+            election_id, precinct_id = ELECTIONS[match[1]], int(match[2])
+            yield pytest.param(
+                (path.stem, election_id, precinct_id),
+                id=f'{election_id}-{precinct_id}',
+            )
+
+
+@pytest.fixture(scope='module')
+def vcr_cassette_dir():
+    return str(CASSETTES)
+
+
+@pytest.fixture(scope='module')
+def vcr_config():
+    return {'record_mode': 'none'}
+
+
+@pytest.fixture(params=list(find_ballots()))
+def cassette(request):
+    return request.param
+
+
+@pytest.fixture
+def vcr_cassette_name(cassette):
+    return cassette[0]
+
+
+@pytest.fixture
+def website(cassette):
+    defaults.initialize_districts()
+    defaults.initialize_parties()
+
+    _name, election_id, precinct_id = cassette
+    website = BallotWebsite.objects.create(
+        mvic_election_id=election_id, mvic_precinct_id=precinct_id
+    )
+    website.fetch()
+    return website
+
+
+def prepare(website: BallotWebsite, stage: str) -> Callable:
+    """Run the stages before the given one and return a call for it."""
+    stages: Dict[str, Callable] = {
+        'validate': website.validate,
+        'scrape': website.scrape,
+        'convert': website.convert,
+    }
+    for name, run in stages.items():
+        if name == stage:
+            return run
+        run()
+
+    ballot = website.convert()
+    ballot.website = website
+    return ballot.parse
+
+
+def measure(run: Callable) -> Dict:
+    tracemalloc.start()
+    try:
+        with CaptureQueriesContext(connection) as context:
+            run()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'queries': len(context.captured_queries), 'peak_memory': peak}
+
+
+@pytest.mark.django_db
+@pytest.mark.vcr
+@pytest.mark.parametrize('stage', STAGES)
+def test_pipeline(benchmark, website, cassette, stage):
+    run = prepare(website, stage)
+
+    # The first run is measured cold, as it would be during a crawl
+    info = measure(run)
+    benchmark.extra_info.update(info)
+    RESULTS.append(dict(info, stage=stage, ballot=cassette[0]))
+
+    benchmark.pedantic(run, rounds=ROUNDS, iterations=1)
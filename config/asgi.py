@@ -0,0 +1,10 @@
+import os
+
+from django.core.asgi import get_asgi_application
+
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.production")
+
+# Serves the async registration lookup from its own process, alongside the
+# WSGI workers: uvicorn config.asgi:application
+application = get_asgi_application()
@@ -61,6 +61,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+ASGI_APPLICATION = 'config.asgi.application'
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
@@ -124,6 +126,29 @@ CORS_ORIGIN_ALLOW_ALL = True
 
 GRAPPELLI_ADMIN_TITLE = "Michigan Elections Admin"
 
+###############################################################################
+# MVIC
+
+MVIC_POOL_SIZE = int(os.getenv('MVIC_POOL_SIZE', '10'))
+
+MVIC_RETRIES = int(os.getenv('MVIC_RETRIES', '2'))
+
+MVIC_BREAKER_THRESHOLD = int(os.getenv('MVIC_BREAKER_THRESHOLD', '5'))
+
+MVIC_BREAKER_COOLDOWN = float(os.getenv('MVIC_BREAKER_COOLDOWN', '2'))
+
+MVIC_BREAKER_MAX_COOLDOWN = float(os.getenv('MVIC_BREAKER_MAX_COOLDOWN', '120'))
+
+MVIC_BREAKER_MAX_WAIT = float(os.getenv('MVIC_BREAKER_MAX_WAIT', '300'))
+
+REGISTRATION_CACHE_TIMEOUT = int(os.getenv('REGISTRATION_CACHE_TIMEOUT', '300'))
+
+REGISTRATION_CACHE_NEGATIVE_TIMEOUT = int(
+    os.getenv('REGISTRATION_CACHE_NEGATIVE_TIMEOUT', '60')
+)
+
+REGISTRATION_LOCK_TIMEOUT = int(os.getenv('REGISTRATION_LOCK_TIMEOUT', '15'))
+
 ###############################################################################
 # Django REST Framework
 
@@ -135,6 +160,14 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 100,
 }
 
+API_FAST_SERIALIZERS = os.getenv('API_FAST_SERIALIZERS', 'true').lower() == 'true'
+
+API_CACHE_MAX_AGE = int(os.getenv('API_CACHE_MAX_AGE', '60'))
+
+API_RESPONSE_CACHE_TIMEOUT = int(os.getenv('API_RESPONSE_CACHE_TIMEOUT', '3600'))
+
+API_EXPORT_CHUNK_SIZE = int(os.getenv('API_EXPORT_CHUNK_SIZE', '2000'))
+
 ###############################################################################
 # Swagger
 
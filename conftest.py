@@ -0,0 +1,25 @@
+from typing import List
+
+from django.core.cache import cache
+
+import pytest
+
+from elections.models import District, DistrictCategory, Party, ReferenceManager
+
+
+@pytest.fixture(autouse=True)
+def reference_cache():
+    """Forget cached reference data rolled back by the previous test."""
+    managers: List[ReferenceManager] = [
+        DistrictCategory.objects,
+        District.objects,
+        Party.objects,
+    ]
+    for manager in managers:
+        manager.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def response_cache():
+    """Forget registration lookups cached by the previous test."""
+    cache.clear()
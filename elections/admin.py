@@ -4,7 +4,7 @@ from django.contrib import admin
 from django.shortcuts import redirect, reverse
 from django.utils.html import format_html
 
-from . import models
+from . import helpers, models
 
 
 class DefaultFiltersMixin(admin.ModelAdmin):
@@ -32,8 +32,22 @@ class DefaultFiltersMixin(admin.ModelAdmin):
         return super().changelist_view(request, *args, **kwargs)
 
 
+class DataVersionMixin(admin.ModelAdmin):
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        helpers.bump_data_version_on_commit()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        helpers.bump_data_version_on_commit()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        helpers.bump_data_version_on_commit()
+
+
 @admin.register(models.DistrictCategory)
-class DistrictCategoryAdmin(admin.ModelAdmin):
+class DistrictCategoryAdmin(DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['name']
 
@@ -44,7 +58,7 @@ class DistrictCategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(models.District)
-class DistrictAdmin(admin.ModelAdmin):
+class DistrictAdmin(DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['name']
 
@@ -56,7 +70,7 @@ class DistrictAdmin(admin.ModelAdmin):
 
 
 @admin.register(models.Election)
-class ElectionAdmin(admin.ModelAdmin):
+class ElectionAdmin(DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['name', 'mvic_id']
 
@@ -76,7 +90,7 @@ class ElectionAdmin(admin.ModelAdmin):
 
 
 @admin.register(models.Precinct)
-class PrecinctAdmin(admin.ModelAdmin):
+class PrecinctAdmin(DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['county__name', 'jurisdiction__name', 'ward', 'number']
 
@@ -89,18 +103,21 @@ def scrape_selected_ballots(modeladmin, request, queryset):
         website.validate()
         website.scrape()
         website.convert()
+    helpers.bump_data_version_on_commit()
 
 
 def parse_selected_ballots(modeladmin, request, queryset):
     for website in queryset:
         ballot = website.convert()
         ballot.parse()
+    helpers.bump_data_version_on_commit()
 
 
 @admin.register(models.BallotWebsite)
 class BallotWebsiteAdmin(DefaultFiltersMixin, admin.ModelAdmin):
 
-    search_fields = ['mvic_election_id', 'mvic_precinct_id', 'mvic_html']
+    # The compressed HTML cannot be matched in SQL, so search the parsed data
+    search_fields = ['mvic_election_id', 'mvic_precinct_id', 'data']
 
     list_filter = ['mvic_election_id', 'fetched', 'valid', 'parsed']
     default_filters = [
@@ -209,7 +226,7 @@ class PrecinctJurisdictionListFilter(admin.SimpleListFilter):
 
 
 @admin.register(models.Ballot)
-class BallotAdmin(DefaultFiltersMixin, admin.ModelAdmin):
+class BallotAdmin(DefaultFiltersMixin, DataVersionMixin, admin.ModelAdmin):
 
     search_fields = [
         'website__mvic_election_id',
@@ -280,7 +297,7 @@ class BallotAdmin(DefaultFiltersMixin, admin.ModelAdmin):
 
 
 @admin.register(models.Party)
-class PartyAdmin(admin.ModelAdmin):
+class PartyAdmin(DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['name']
 
@@ -302,7 +319,7 @@ class PartyAdmin(admin.ModelAdmin):
 
 
 @admin.register(models.Proposal)
-class ProposalAdmin(DefaultFiltersMixin, admin.ModelAdmin):
+class ProposalAdmin(DefaultFiltersMixin, DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['name', 'description', 'reference_url']
 
@@ -326,7 +343,7 @@ class ProposalAdmin(DefaultFiltersMixin, admin.ModelAdmin):
 
 
 @admin.register(models.Position)
-class PositionAdmin(DefaultFiltersMixin, admin.ModelAdmin):
+class PositionAdmin(DefaultFiltersMixin, DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['name', 'description', 'reference_url']
 
@@ -361,7 +378,7 @@ class PositionAdmin(DefaultFiltersMixin, admin.ModelAdmin):
 
 
 @admin.register(models.Candidate)
-class CandidateAdmin(DefaultFiltersMixin, admin.ModelAdmin):
+class CandidateAdmin(DefaultFiltersMixin, DataVersionMixin, admin.ModelAdmin):
 
     search_fields = ['name', 'position__name', 'description', 'reference_url']
 
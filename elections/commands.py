@@ -1,11 +1,23 @@
 import itertools
-from typing import Optional, Set
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from typing import Callable, Deque, Dict, Generator, List, Optional, Set, Tuple
+
+from django.conf import settings
+from django.db import connection, connections
 
 import log
 
+from . import helpers
 from .models import Ballot, BallotWebsite, Election, Precinct
 
 
+# Conversion creates elections and precincts, which are not safe to race
+_convert_lock = threading.Lock()
+
+
 def scrape_ballots(
     *,
     starting_election_id: Optional[int] = None,
@@ -13,6 +25,8 @@ def scrape_ballots(
     ballot_limit: Optional[int] = None,
     max_election_error_count: int = 3,
     max_ballot_error_count: int = 1000,
+    workers: int = 1,
+    rate_limit: Optional[float] = None,
 ):
     last_election = Election.objects.exclude(active=True).last()
     current_election = Election.objects.filter(active=True).first()
@@ -30,7 +44,12 @@ def scrape_ballots(
     error_count = 0
     for election_id in itertools.count(starting_election_id):
         ballot_count = _scrape_ballots_for_election(
-            election_id, starting_precinct_id, ballot_limit, max_ballot_error_count
+            election_id,
+            starting_precinct_id,
+            ballot_limit,
+            max_ballot_error_count,
+            workers=workers,
+            rate_limit=rate_limit,
         )
 
         if ballot_count:
@@ -52,61 +71,185 @@ def _scrape_ballots_for_election(
     starting_precinct_id: int,
     limit: Optional[int],
     max_ballot_error_count: int,
+    *,
+    workers: int = 1,
+    rate_limit: Optional[float] = None,
 ) -> int:
     log.info(f'Scrapping ballots for election {election_id}')
     log.info(f'Starting from precinct {starting_precinct_id}')
     if limit:
         log.info(f'Stopping after {limit} ballots')
+    if workers > 1:
+        log.info(f'Fetching ballots with {workers} workers')
 
     ballot_count = 0
     error_count = 0
 
-    for precinct_id in itertools.count(starting_precinct_id):
-        website, created = BallotWebsite.objects.get_or_create(
-            mvic_election_id=election_id, mvic_precinct_id=precinct_id
-        )
-        if created:
-            log.info(f'Discovered new website: {website}')
-        if website.stale or limit:
-            website.fetch()
-            website.validate() and website.scrape() and website.convert()
-        if website.valid:
-            ballot_count += 1
-            error_count = 0
-        else:
-            error_count += 1
+    def lookahead() -> int:
+        # No stop rule can be reached before this many more results
+        count = max_ballot_error_count - error_count
+        if limit:
+            count = min(count, limit - ballot_count)
+        return count
 
-        if limit and ballot_count >= limit:
-            break
+    limiter = helpers.RateLimiter(rate_limit)
+    results = _scrape_precincts(
+        election_id, starting_precinct_id, limit, limiter, workers, lookahead
+    )
+    with closing(results):
+        for valid in results:
+            if valid:
+                ballot_count += 1
+                error_count = 0
+            else:
+                error_count += 1
 
-        if error_count >= max_ballot_error_count:
-            log.info(f'No more ballots to scrape for election {election_id}')
-            break
+            if limit and ballot_count >= limit:
+                break
+
+            if error_count >= max_ballot_error_count:
+                log.info(f'No more ballots to scrape for election {election_id}')
+                break
 
     return ballot_count
 
 
-def parse_ballots(*, election_id: Optional[int] = None):
+def _scrape_precincts(
+    election_id: int,
+    starting_precinct_id: int,
+    limit: Optional[int],
+    limiter: helpers.RateLimiter,
+    workers: int,
+    lookahead: Callable[[], int],
+) -> Generator[bool, None, None]:
+    """Yield the validity of each consecutive precinct's ballot in order."""
+    precinct_ids = itertools.count(starting_precinct_id)
+
+    if workers <= 1:
+        for precinct_id in precinct_ids:
+            yield _scrape_ballot(election_id, precinct_id, limit, limiter)
+        return
+
+    # Results are consumed in precinct order so stop rules see the same
+    # sequence as a serial crawl, while a bounded window is fetched ahead
+    # that never extends past the point where a stop rule could be reached
+    pending: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            while True:
+                while len(pending) < min(workers * 2, lookahead()):
+                    future = executor.submit(
+                        _scrape_ballot_in_thread,
+                        election_id,
+                        next(precinct_ids),
+                        limit,
+                        limiter,
+                    )
+                    pending.append(future)
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _scrape_ballot(
+    election_id: int,
+    precinct_id: int,
+    limit: Optional[int],
+    limiter: helpers.RateLimiter,
+) -> bool:
+    website, created = BallotWebsite.objects.get_or_create(
+        mvic_election_id=election_id, mvic_precinct_id=precinct_id
+    )
+    if created:
+        log.info(f'Discovered new website: {website}')
+    if website.stale or limit:
+        limiter.wait(website.mvic_url)
+        fetched = website.fetch(wait=settings.MVIC_BREAKER_MAX_WAIT)
+        if fetched and website.validate() and website.scrape():
+            with _convert_lock:
+                website.convert()
+    return bool(website.valid)
+
+
+def _scrape_ballot_in_thread(*args) -> bool:
+    try:
+        return _scrape_ballot(*args)
+    finally:
+        connection.close()
+
+
+def parse_ballots(
+    *, election_id: Optional[int] = None, incremental: bool = True, workers: int = 1
+):
     if election_id:
         elections = Election.objects.filter(mvic_id=election_id)
     else:
         elections = Election.objects.filter(active=True)
 
     for election in elections:
-        _parse_ballots_for_election(election)
+        _parse_ballots_for_election(election, incremental=incremental, workers=workers)
 
 
-def _parse_ballots_for_election(election: Election):
+def _parse_ballots_for_election(
+    election: Election, *, incremental: bool = True, workers: int = 1
+):
     log.info(f'Parsing ballots for election {election.mvic_id}')
 
+    websites = BallotWebsite.objects.filter(
+        mvic_election_id=election.mvic_id, valid=True
+    ).order_by('-mvic_precinct_id')
+    log.info(f'Mapping {websites.count()} websites to ballots')
+
+    shards = _shard_websites(websites, workers)
+
+    if len(shards) > 1:
+        # Forked workers must open their own database connections
+        connections.close_all()
+        with ProcessPoolExecutor(len(shards)) as executor:
+            count = sum(
+                executor.map(_parse_websites, shards, itertools.repeat(incremental))
+            )
+    else:
+        count = sum(_parse_websites(shard, incremental) for shard in shards)
+
+    log.info(f'Parsed ballots for {count} precincts')
+
+
+def _shard_websites(websites, count: int) -> List[List[int]]:
+    """Partition website IDs so that each precinct is parsed by one worker."""
+    groups: Dict[Tuple, List[int]] = {}
+
+    for website_id, precinct in websites.values_list('id', 'data__precinct'):
+        if precinct is None:
+            website = BallotWebsite.objects.get(id=website_id)
+            website.scrape()
+            precinct = website.data['precinct']
+        # Group on the values a saved precinct is matched by
+        county_name, jurisdiction_name, ward, number = precinct
+        key = (
+            county_name,
+            jurisdiction_name,
+            Precinct.normalize_number(ward),
+            Precinct.normalize_number(number),
+        )
+        groups.setdefault(key, []).append(website_id)
+
+    shards: List[List[int]] = [[] for _ in range(min(count, len(groups)) or 1)]
+    for index, website_ids in enumerate(groups.values()):
+        shards[index % len(shards)].extend(website_ids)
+
+    return [shard for shard in shards if shard]
+
+
+def _parse_websites(website_ids: List[int], incremental: bool) -> int:
     precincts: Set[Precinct] = set()
 
     websites = (
-        BallotWebsite.objects.filter(mvic_election_id=election.mvic_id, valid=True)
+        BallotWebsite.objects.filter(id__in=website_ids)
         .order_by('-mvic_precinct_id')
         .defer('mvic_html', 'data')
     )
-    log.info(f'Mapping {websites.count()} websites to ballots')
 
     for website in websites:
 
@@ -129,6 +272,6 @@ def _parse_ballots_for_election(election: Election):
             ballot.save()
 
             if ballot.stale:
-                ballot.parse()
+                ballot.parse(incremental=incremental)
 
-    log.info(f'Parsed ballots for {len(precincts)} precincts')
+    return len(precincts)
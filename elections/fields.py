@@ -1,6 +1,42 @@
+import zlib
+
+from django.db import models
+
 from rest_framework import serializers
 
 
+class CompressedTextField(models.BinaryField):
+    """Text stored compressed with zlib and decompressed on access."""
+
+    description = "Compressed text"
+    empty_values = [None, '', b'']
+
+    def get_default(self):
+        default = super().get_default()
+        if default == b'':
+            return ''
+        return default
+
+    def from_db_value(self, value, _expression, _connection):
+        return self.to_python(value)
+
+    def to_python(self, value):
+        if isinstance(value, memoryview):
+            value = value.tobytes()
+        if isinstance(value, bytes):
+            return zlib.decompress(value).decode() if value else ''
+        return value
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if isinstance(value, str):
+            return zlib.compress(value.encode()) if value else b''
+        return value
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+
 class NullCharField(serializers.CharField):
     def to_representation(self, value):
         if not value:
@@ -42,6 +42,14 @@ class VoterFilter(InitialilzedFilterSet):
         required=True,
         help_text="Date (YYYY-MM-DD) voter was born.",
     )
+    refresh = filters.BooleanFilter(
+        method='filter_refresh',
+        help_text="Skip recently cached results for this voter. Defaults to false.",
+    )
+
+    @staticmethod
+    def filter_refresh(queryset, _name, _value):
+        return queryset
 
 
 class ElectionFilter(InitialilzedFilterSet):
@@ -158,7 +166,41 @@ class BallotFilter(InitialilzedFilterSet):
     )
 
 
-class ProposalFilter(InitialilzedFilterSet):
+class BallotItemFilterSet(InitialilzedFilterSet):
+    """Look up ballot items by precinct in the denormalized index."""
+
+    item_type = ''
+    index_lookups = {
+        'precinct_id': 'precinct',
+        'precinct_county': 'county',
+        'precinct_jurisdiction': 'jurisdiction',
+        'precinct_ward': 'ward',
+        'precinct_number': 'number',
+    }
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+
+        # All precinct filters must match the same precinct, so apply them at once
+        lookups = {
+            field: self.form.cleaned_data[name]
+            for name, field in self.index_lookups.items()
+            if self.form.cleaned_data.get(name) not in {None, ''}
+        }
+        if lookups:
+            items = models.BallotItemIndex.objects.filter(
+                item_type=self.item_type, **lookups
+            )
+            queryset = queryset.filter(id__in=items.values('item_id'))
+
+        return queryset
+
+    @staticmethod
+    def filter_by_index(queryset, _name, _value):
+        return queryset
+
+
+class ProposalFilter(BallotItemFilterSet):
     class Meta:
         model = models.Proposal
         fields = [
@@ -171,6 +213,8 @@ class ProposalFilter(InitialilzedFilterSet):
             'active_election',
         ]
 
+    item_type = 'proposal'
+
     # Election ID lookup
 
     election_id = filters.NumberFilter(
@@ -191,6 +235,7 @@ class ProposalFilter(InitialilzedFilterSet):
 
     precinct_id = filters.NumberFilter(
         field_name='precincts',
+        method='filter_by_index',
         label="Precinct ID",
         help_text="Integer value identifying a specific precinct.",
     )
@@ -199,27 +244,31 @@ class ProposalFilter(InitialilzedFilterSet):
 
     precinct_county = filters.CharFilter(
         field_name='precincts__county__name',
+        method='filter_by_index',
         label="County",
         help_text="Name of the precinct's county.",
     )
     precinct_jurisdiction = filters.CharFilter(
         field_name='precincts__jurisdiction__name',
+        method='filter_by_index',
         label="Jurisdiction",
         help_text="Name of the precinct's jurisdiction.",
     )
     precinct_ward = filters.CharFilter(
         field_name='precincts__ward',
+        method='filter_by_index',
         label="Ward",
         help_text="Ward containing the precinct.",
     )
     precinct_number = filters.CharFilter(
         field_name='precincts__number',
+        method='filter_by_index',
         label="Precinct",
         help_text="Number of the precinct.",
     )
 
 
-class PositionFilter(InitialilzedFilterSet):
+class PositionFilter(BallotItemFilterSet):
     class Meta:
         model = models.Position
         fields = [
@@ -232,6 +281,8 @@ class PositionFilter(InitialilzedFilterSet):
             'active_election',
         ]
 
+    item_type = 'position'
+
     # Election ID lookup
 
     election_id = filters.NumberFilter(
@@ -252,6 +303,7 @@ class PositionFilter(InitialilzedFilterSet):
 
     precinct_id = filters.NumberFilter(
         field_name='precincts',
+        method='filter_by_index',
         label="Precinct ID",
         help_text="Integer value identifying a specific precinct.",
     )
@@ -260,21 +312,44 @@ class PositionFilter(InitialilzedFilterSet):
 
     precinct_county = filters.CharFilter(
         field_name='precincts__county__name',
+        method='filter_by_index',
         label="County",
         help_text="Name of the precinct's county.",
     )
     precinct_jurisdiction = filters.CharFilter(
         field_name='precincts__jurisdiction__name',
+        method='filter_by_index',
         label="Jurisdiction",
         help_text="Name of the precinct's jurisdiction.",
     )
     precinct_ward = filters.CharFilter(
         field_name='precincts__ward',
+        method='filter_by_index',
         label="Ward",
         help_text="Ward containing the precinct.",
     )
     precinct_number = filters.CharFilter(
         field_name='precincts__number',
+        method='filter_by_index',
         label="Precinct",
         help_text="Number of the precinct.",
     )
+
+
+class BallotDocumentFilter(filters.FilterSet):
+    class Meta:
+        model = models.BallotDocument
+        fields = ['election_id', 'precinct_id']
+
+    election_id = filters.NumberFilter(
+        field_name='election',
+        required=True,
+        label="Election ID",
+        help_text="Integer value identifying a specific election.",
+    )
+    precinct_id = filters.NumberFilter(
+        field_name='precinct',
+        required=True,
+        label="Precinct ID",
+        help_text="Integer value identifying a specific precinct.",
+    )
@@ -1,18 +1,48 @@
+# pylint: disable=too-many-lines
+
+import asyncio
+import random
 import re
+import secrets
 import string
+import threading
 import time
 from contextlib import contextmanager
 from datetime import date, datetime
+from functools import lru_cache
+from http.cookiejar import CookieJar, DefaultCookiePolicy
 from importlib import resources
-from typing import Any, Dict, Generator, List, Optional, Tuple
-
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+)
+from urllib.parse import urlparse
+from weakref import WeakKeyDictionary
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.db import transaction
+from django.utils.crypto import salted_hmac
+
+import httpx
 import log
 import pomace
 import requests
+from asgiref.sync import sync_to_async
 from bs4 import BeautifulSoup
 from bs4.element import Tag
 from fake_useragent import UserAgent
 from nameparser import HumanName
+from redis_cache.backends.base import BaseRedisCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from . import exceptions
 from .constants import MVIC_URL
@@ -20,30 +50,283 @@ from .constants import MVIC_URL
 
 useragent = UserAgent()
 
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_async_clients: MutableMapping[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = WeakKeyDictionary()
+
+# lxml produces the same ballot data as 'html.parser' (see the VCR cassettes)
+SOUP_FEATURES = 'lxml'
+
 ###############################################################################
 # Shared helpers
 
 
 @contextmanager
 def mvic_session() -> Generator[requests.Session, None, None]:
+    """Share one session so connections to MVIC are kept alive and reused."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_mvic_session()
+    yield _session
+
+
+def mvic_async_client() -> httpx.AsyncClient:
+    """Share one async client per event loop so connections to MVIC are reused."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = httpx.AsyncClient(
+            verify=_get_mvic_certificate(),
+            headers={'User-Agent': useragent.random},
+            # Lookups for different voters must not share MVIC's session cookies
+            cookies=CookieJar(DefaultCookiePolicy(allowed_domains=[])),
+            transport=httpx.AsyncHTTPTransport(retries=settings.MVIC_RETRIES),
+        )
+    return client
+
+
+def _build_mvic_session() -> requests.Session:
+    session = requests.Session()
+    session.verify = _get_mvic_certificate()
+    session.headers['User-Agent'] = useragent.random
+
+    # Lookups for different voters must not share MVIC's session cookies
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+    retries = Retry(
+        total=settings.MVIC_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=settings.MVIC_POOL_SIZE,
+        max_retries=retries,
+    )
+    session.mount(MVIC_URL, adapter)
+
+    return session
+
+
+@lru_cache()
+def _get_mvic_certificate() -> str:
     with resources.path('config', 'mvic.sos.state.mi.us.pem') as path:
-        session = requests.Session()
-        session.verify = str(path)
-        session.headers['User-Agent'] = useragent.random
-        yield session
+        return str(path)
+
+
+def fetch(
+    url: str,
+    expected_text: str,
+    headers: Optional[Dict[str, str]] = None,
+    *,
+    wait: float = 0,
+) -> requests.Response:
+    with mvic_breaker.guard(wait=wait):
+        with mvic_session() as session:
+            response = session.get(url, headers=headers)
+
+        if response.status_code >= 400:
+            log.error(f'MVIC status code: {response.status_code}')
+            raise exceptions.ServiceUnavailable()
+
+    if response.status_code != 304:
+        assert expected_text in response.text, f'{expected_text!r} not found on {url}'
+    return response
+
+
+class RateLimiter:
+    """Space out requests to each host to stay under a maximum rate."""
+
+    def __init__(self, rate: Optional[float] = None):
+        self.interval = 1 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._schedule: Dict[str, float] = {}
 
+    def wait(self, url: str) -> None:
+        if not self.interval:
+            return
 
-def fetch(url: str, expected_text: str) -> str:
-    with mvic_session() as session:
-        response = session.get(url)
+        host = urlparse(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._schedule.get(host, now))
+            self._schedule[host] = start + self.interval
 
-    if response.status_code >= 400:
-        log.error(f'MVIC status code: {response.status_code}')
-        raise exceptions.ServiceUnavailable()
+        if start > now:
+            log.debug(f'Waiting {start - now:.2f}s to request {url}')
+            time.sleep(start - now)
 
-    text = response.text.strip()
-    assert expected_text in text, f'{expected_text!r} not found on {url}'
-    return text
+
+class CircuitBreaker:
+    """Stop calling a failing service until it has had time to recover.
+
+    The failure count and reopening time are kept in the shared cache, so every
+    worker and the crawler see the same state. A half-open circuit lets one
+    probe through by taking a cache lock.
+    """
+
+    FAILURES = (
+        exceptions.ServiceUnavailable,
+        requests.exceptions.RequestException,
+        httpx.TransportError,
+    )
+
+    def __init__(self, name: str, threshold: int, cooldown: float, max_cooldown: float):
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+    @property
+    def _failures_key(self) -> str:
+        return f'circuit:{self.name}:failures'
+
+    @property
+    def _trips_key(self) -> str:
+        return f'circuit:{self.name}:trips'
+
+    @property
+    def _reopen_key(self) -> str:
+        return f'circuit:{self.name}:reopen'
+
+    @property
+    def _probe_key(self) -> str:
+        return f'circuit:{self.name}:probe'
+
+    @property
+    def state(self) -> str:
+        values = cache.get_many([self._failures_key, self._reopen_key, self._probe_key])
+        if values.get(self._failures_key, 0) < self.threshold:
+            return 'closed'
+        if self._probe_key in values or time.time() < values.get(self._reopen_key, 0):
+            return 'open'
+        return 'half-open'
+
+    def acquire(self) -> Optional[int]:
+        """Return a token if a call may be made, letting one probe through.
+
+        The token is zero unless the call is the probe of a half-open circuit.
+        """
+        values = cache.get_many([self._failures_key, self._reopen_key])
+        if values.get(self._failures_key, 0) < self.threshold:
+            return 0
+        if time.time() < values.get(self._reopen_key, 0):
+            return None
+        # The lock outlives a hung probe so another one can eventually try
+        timeout = int(self.max_cooldown) + 1
+        return acquire_cache_lock(self._probe_key, timeout)
+
+    def wait(self, timeout: float) -> Optional[int]:
+        """Block until a call may be made, giving up after the timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            token = self.acquire()
+            remaining = deadline - time.monotonic()
+            if token is not None or remaining <= 0:
+                return token
+            reopen = cache.get(self._reopen_key, 0)
+            delay = min(max(reopen - time.time(), 0.1), remaining)
+            log.debug(f'Waiting {delay:.2f}s for circuit to close')
+            time.sleep(delay)
+
+    def record_success(self, token: int = 0) -> None:
+        if cache.get(self._failures_key):
+            if cache.get(self._trips_key):
+                log.info("Circuit closed after a successful call")
+            cache.delete_many([self._failures_key, self._trips_key, self._reopen_key])
+        self.release(token)
+
+    def record_failure(self, token: int = 0) -> None:
+        cache.add(self._failures_key, 0, None)
+        failures = cache.incr(self._failures_key)
+
+        # Calls already in flight when the circuit opened don't extend it
+        if failures == self.threshold or (token and failures > self.threshold):
+            cache.add(self._trips_key, 0, None)
+            trips = cache.incr(self._trips_key) - 1
+            delay = min(self.cooldown * 2 ** trips, self.max_cooldown)
+            delay = delay / 2 + random.uniform(0, delay / 2)
+            cache.set(self._reopen_key, time.time() + delay, None)
+            log.warn(f'Circuit opened for {delay:.2f}s')
+        self.release(token)
+
+    def release(self, token: int) -> None:
+        """Let another probe through without recording an outcome."""
+        if token:
+            release_cache_lock(self._probe_key, token)
+
+    @contextmanager
+    def guard(self, *, wait: float = 0) -> Generator[None, None, None]:
+        """Fail fast while open, or wait up to a deadline, and record the outcome."""
+        token = self.wait(wait) if wait else self.acquire()
+        if token is None:
+            log.warn("Circuit is open, skipping call")
+            raise exceptions.ServiceUnavailable()
+
+        try:
+            yield
+        except self.FAILURES:
+            self.record_failure(token)
+            raise
+        except BaseException:
+            self.release(token)
+            raise
+        self.record_success(token)
+
+
+# Shared through the cache so an MVIC outage seen by the crawler or any API
+# worker trips it for all of them
+mvic_breaker = CircuitBreaker(
+    'mvic',
+    settings.MVIC_BREAKER_THRESHOLD,
+    settings.MVIC_BREAKER_COOLDOWN,
+    settings.MVIC_BREAKER_MAX_COOLDOWN,
+)
+
+
+class SingleFlight:
+    """Let concurrent callers with the same key share one call's result."""
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, SingleFlight._Call] = {}
+
+    def run(self, key: str, function: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            log.debug(f'Waiting on in-flight call: {key}')
+            call.done.wait()
+            if call.error:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
 
 
 def visit(url: str, expected_text: str) -> pomace.Page:
@@ -55,6 +338,11 @@ def visit(url: str, expected_text: str) -> pomace.Page:
     return page
 
 
+def build_soup(html: str) -> BeautifulSoup:
+    """Parse ballot HTML with lxml, which is faster than 'html.parser'."""
+    return BeautifulSoup(html, SOUP_FEATURES)
+
+
 def titleize(text: str) -> str:
     return (
         string.capwords(text)
@@ -138,54 +426,322 @@ def build_mvic_url(election_id: int, precinct_id: int) -> str:
     return f'{MVIC_URL}/Voter/GetMvicBallot/{precinct_id}/{election_id}/'
 
 
+DATA_VERSION_KEY = 'data-version'
+DATA_MODIFIED_KEY = 'data-modified'
+
+
+def get_data_version() -> int:
+    """Identify the current state of the scraped and parsed data."""
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        version = bump_data_version()
+    return version
+
+
+def get_data_modified() -> int:
+    """Return the timestamp of the last change to the scraped and parsed data."""
+    modified = cache.get(DATA_MODIFIED_KEY)
+    if modified is None:
+        bump_data_version()
+        modified = cache.get(DATA_MODIFIED_KEY)
+    return modified
+
+
+def bump_data_version() -> int:
+    """Invalidate API responses after the data they were built from changes."""
+    now = int(time.time())
+    # Starting from a timestamp keeps versions unique if the cache is ever cleared
+    cache.add(DATA_VERSION_KEY, now, None)
+    version = cache.incr(DATA_VERSION_KEY)
+    cache.set(DATA_MODIFIED_KEY, now, None)
+    log.info(f'Bumped data version to {version}')
+    return version
+
+
+def bump_data_version_on_commit():
+    """Invalidate API responses once the current transaction's changes are saved."""
+    transaction.on_commit(bump_data_version)
+
+
+_RELEASE_LOCK_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def acquire_cache_lock(key: str, timeout: int) -> Optional[int]:
+    """Take a lock shared by all workers, returning a token to release it."""
+    # Integers are stored unserialized in Redis, so a script can compare them
+    token = secrets.randbits(62) + 1
+    return token if cache.add(key, token, timeout) else None
+
+
+def release_cache_lock(key: str, token: int) -> None:
+    """Release a lock unless it expired and was taken by another worker."""
+    backend = caches[DEFAULT_CACHE_ALIAS]
+    if isinstance(backend, BaseRedisCache):
+        redis_key = backend.make_key(key)
+        client = backend.get_client(redis_key, write=True)
+        client.eval(_RELEASE_LOCK_SCRIPT, 1, redis_key, token)
+    elif cache.get(key) == token:
+        cache.delete(key)
+
+
+def count_response_cache_lookup(name: str, *, hit: bool) -> None:
+    key = f'response-cache:{name}:{"hits" if hit else "misses"}'
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        log.debug(f'Unable to count response cache lookup: {key}')
+
+
+def get_response_cache_stats(name: str) -> Tuple[int, int]:
+    hits = cache.get(f'response-cache:{name}:hits', 0)
+    misses = cache.get(f'response-cache:{name}:misses', 0)
+    return hits, misses
+
+
 ###############################################################################
 # Registration helpers
 
 
-def fetch_registration_status_data(voter):
+_registration_lookups = SingleFlight()
+_async_registration_lookups: MutableMapping[
+    asyncio.AbstractEventLoop, Dict[str, asyncio.Future]
+] = WeakKeyDictionary()
+
+
+def fetch_registration_status_data(voter, *, refresh: bool = False) -> Dict:
+    """Look up a voter on MVIC, reusing recent results unless refreshing."""
+    key = build_registration_cache_key(voter)
+    if not refresh:
+        data = cache.get(key)
+        if data is not None:
+            log.info("Using cached registration status")
+            return data
+
+    return _registration_lookups.run(
+        key, lambda: _fetch_registration_status_data_once(voter, key)
+    )
+
+
+def _fetch_registration_status_data_once(voter, key: str) -> Dict:
+    """Let one worker at a time look up a voter while the others wait."""
+    lock_key = f'{key}:lock'
+    token = acquire_cache_lock(lock_key, settings.REGISTRATION_LOCK_TIMEOUT)
+
+    if token is None:
+        log.info("Waiting on registration lookup in another worker")
+        data = _wait_for_registration_status_data(key, lock_key)
+        if data is not None:
+            return data
+        log.warn("Registration lookup in another worker was not cached")
+        token = acquire_cache_lock(lock_key, settings.REGISTRATION_LOCK_TIMEOUT)
+
+    try:
+        data = _fetch_registration_status_data(voter)
+        if data['registered'] is not None:
+            _cache_registration_status_data(key, data)
+    finally:
+        if token is not None:
+            release_cache_lock(lock_key, token)
+
+    return data
+
+
+def _wait_for_registration_status_data(key: str, lock_key: str) -> Optional[Dict]:
+    """Poll with backoff until another worker caches its lookup or gives up."""
+    delays = _iter_lock_delays()
+    while True:
+        data, locked = _check_registration_status_data(key, lock_key)
+        delay = next(delays, None)
+        if data is not None or not locked or delay is None:
+            return data
+        time.sleep(delay)
+
+
+def _check_registration_status_data(
+    key: str, lock_key: str
+) -> Tuple[Optional[Dict], bool]:
+    values = cache.get_many([key, lock_key])
+    return values.get(key), lock_key in values
+
+
+def _iter_lock_delays() -> Iterator[float]:
+    deadline = time.monotonic() + settings.REGISTRATION_LOCK_TIMEOUT
+    delay = 0.05
+    while time.monotonic() < deadline:
+        yield max(min(delay, deadline - time.monotonic()), 0)
+        delay = min(delay * 2, 1.0)
+
+
+def _cache_registration_status_data(key: str, data: Dict) -> None:
+    if data['registered']:
+        timeout = settings.REGISTRATION_CACHE_TIMEOUT
+    else:
+        timeout = settings.REGISTRATION_CACHE_NEGATIVE_TIMEOUT
+    cache.set(key, data, timeout)
+
+
+def build_registration_cache_key(voter) -> str:
+    """Identify a voter's lookup without storing their details in the cache."""
+    value = '|'.join(
+        [
+            voter.first_name.strip().lower(),
+            voter.last_name.strip().lower(),
+            f'{voter.birth_date:%Y-%m-%d}',
+            str(voter.zip_code).strip(),
+        ]
+    )
+    digest = salted_hmac('elections.registration', value).hexdigest()
+    return f'registration:{digest}'
+
+
+def _fetch_registration_status_data(voter) -> Dict:
     url = f'{MVIC_URL}/Voter/SearchByName'
     log.info(f"Submitting form on {url}")
-    with mvic_session() as session:
+    with mvic_breaker.guard(), mvic_session() as session:
         try:
             response = session.post(
                 url,
                 headers={'Content-Type': "application/x-www-form-urlencoded"},
-                data={
-                    'FirstName': voter.first_name,
-                    'LastName': voter.last_name,
-                    'NameBirthMonth': voter.birth_month,
-                    'NameBirthYear': voter.birth_year,
-                    'ZipCode': voter.zip_code,
-                },
+                data=build_registration_form(voter),
                 timeout=10,
             )
-        except requests.exceptions.ConnectionError as e:
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
             log.error(f'MVIC connection error: {e}')
             raise exceptions.ServiceUnavailable()
 
-    if response.status_code >= 400:
-        log.error(f'MVIC status code: {response.status_code}')
-        raise exceptions.ServiceUnavailable()
+        if response.status_code >= 400:
+            log.error(f'MVIC status code: {response.status_code}')
+            raise exceptions.ServiceUnavailable()
+
+    return parse_registration_status_data(response.text)
+
+
+async def fetch_registration_status_data_async(voter, *, refresh: bool = False) -> Dict:
+    """Look up a voter on MVIC without blocking the event loop."""
+    key = build_registration_cache_key(voter)
+    if not refresh:
+        data = await sync_to_async(cache.get, thread_sensitive=False)(key)
+        if data is not None:
+            log.info("Using cached registration status")
+            return data
+
+    lookups = _async_registration_lookups.setdefault(asyncio.get_running_loop(), {})
+    task = lookups.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _fetch_registration_status_data_once_async(voter, key)
+        )
+        lookups[key] = task
+        task.add_done_callback(lambda _: lookups.pop(key, None))
+    else:
+        log.debug(f'Waiting on in-flight call: {key}')
+
+    return await asyncio.shield(task)
 
-    html = BeautifulSoup(response.text, 'html.parser')
+
+async def _fetch_registration_status_data_once_async(voter, key: str) -> Dict:
+    """Share the cross-worker lock with synchronous lookups of the voter."""
+    lock_key = f'{key}:lock'
+    acquire = sync_to_async(acquire_cache_lock, thread_sensitive=False)
+    token = await acquire(lock_key, settings.REGISTRATION_LOCK_TIMEOUT)
+
+    if token is None:
+        log.info("Waiting on registration lookup in another worker")
+        data = await _wait_for_registration_status_data_async(key, lock_key)
+        if data is not None:
+            return data
+        log.warn("Registration lookup in another worker was not cached")
+        token = await acquire(lock_key, settings.REGISTRATION_LOCK_TIMEOUT)
+
+    try:
+        return await _fetch_registration_status_data_async(voter, key)
+    finally:
+        if token is not None:
+            await sync_to_async(release_cache_lock, thread_sensitive=False)(
+                lock_key, token
+            )
+
+
+async def _wait_for_registration_status_data_async(
+    key: str, lock_key: str
+) -> Optional[Dict]:
+    check = sync_to_async(_check_registration_status_data, thread_sensitive=False)
+    delays = _iter_lock_delays()
+    while True:
+        data, locked = await check(key, lock_key)
+        delay = next(delays, None)
+        if data is not None or not locked or delay is None:
+            return data
+        await asyncio.sleep(delay)
+
+
+async def _fetch_registration_status_data_async(voter, key: str) -> Dict:
+    url = f'{MVIC_URL}/Voter/SearchByName'
+    log.info(f"Submitting form on {url}")
+    with mvic_breaker.guard():
+        try:
+            response = await mvic_async_client().post(
+                url,
+                headers={'Content-Type': "application/x-www-form-urlencoded"},
+                data=build_registration_form(voter),
+                timeout=10,
+            )
+        except httpx.TransportError as e:
+            log.error(f'MVIC connection error: {e}')
+            raise exceptions.ServiceUnavailable()
+
+        if response.status_code >= 400:
+            log.error(f'MVIC status code: {response.status_code}')
+            raise exceptions.ServiceUnavailable()
+
+    data = await sync_to_async(parse_registration_status_data, thread_sensitive=False)(
+        response.text
+    )
+    if data['registered'] is not None:
+        await sync_to_async(_cache_registration_status_data, thread_sensitive=False)(
+            key, data
+        )
+
+    return data
+
+
+def build_registration_form(voter) -> Dict:
+    return {
+        'FirstName': voter.first_name,
+        'LastName': voter.last_name,
+        'NameBirthMonth': voter.birth_month,
+        'NameBirthYear': voter.birth_year,
+        'ZipCode': voter.zip_code,
+    }
+
+
+def parse_registration_status_data(text: str) -> Dict:
+    """Parse registration status from MVIC's search results page."""
+    html = BeautifulSoup(text, 'html.parser')
 
     # Parse registration
     registered = None
-    for delay in [0, 1]:
-        time.sleep(delay)
-        if "Yes, you are registered!" in response.text:
-            registered = True
-            break
-        if "No voter record matched your search criteria" in response.text:
-            registered = False
-            break
+    if "Yes, you are registered!" in text:
+        registered = True
+    elif "No voter record matched your search criteria" in text:
+        registered = False
+    else:
         log.warn("Unable to determine registration status")
 
     # Parse moved status
-    recently_moved = "you have recently moved" in response.text
+    recently_moved = "you have recently moved" in text
 
     # Parse absentee status
-    absentee = "You are on the permanent absentee voter list" in response.text
+    absentee = "You are on the permanent absentee voter list" in text
 
     # Parse absentee dates
     absentee_dates: Dict[str, Optional[date]] = {
@@ -293,15 +849,21 @@ def _clean_district_category(text: str):
 # Ballot helpers
 
 
-def fetch_ballot(url: str) -> str:
+def fetch_ballot(
+    url: str, *, etag: str = '', last_modified: str = '', wait: float = 0
+) -> requests.Response:
     log.info(f'Fetching ballot: {url}')
-    return fetch(url, "PreviewMvicBallot")
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return fetch(url, "PreviewMvicBallot", headers, wait=wait)
 
 
-def parse_election(html: str) -> Tuple[str, Tuple[int, int, int]]:
-    """Parse election information from ballot HTML."""
-    soup = BeautifulSoup(html, 'html.parser')
-    header = soup.find(id='PreviewMvicBallot').div.div.div.text
+def parse_election(soup: BeautifulSoup) -> Tuple[str, Tuple[int, int, int]]:
+    """Parse election information from the ballot header."""
+    header = _find_header(soup).text
 
     election_name_text, election_date_text, *_ = header.strip().split('\n')
     election_name = titleize(election_name_text)
@@ -310,8 +872,9 @@ def parse_election(html: str) -> Tuple[str, Tuple[int, int, int]]:
     return election_name, (election_date.year, election_date.month, election_date.day)
 
 
-def parse_precinct(html: str, url: str) -> Tuple[str, str, str, str]:
-    """Parse precinct information from ballot HTML."""
+def parse_precinct(soup: BeautifulSoup, url: str) -> Tuple[str, str, str, str]:
+    """Parse precinct information from the ballot header."""
+    html = str(_find_header(soup))
 
     # Parse county
     match = re.search(r'(?P<county>[^>]+) County, Michigan', html, re.IGNORECASE)
@@ -362,9 +925,12 @@ def parse_district_from_proposal(category: str, text: str, mvic_url: str) -> str
     raise ValueError(f'Could not find {category!r} in {text!r} on {mvic_url}')
 
 
-def parse_ballot(html: str, data: Dict) -> int:
+def _find_header(soup: BeautifulSoup) -> Tag:
+    return soup.find(id='PreviewMvicBallot').div.div.div
+
+
+def parse_ballot(soup: BeautifulSoup, data: Dict) -> int:
     """Call all parsers to insert ballot data into the provided dictionary."""
-    soup = BeautifulSoup(html, 'html.parser')
     ballot = soup.find(id='PreviewMvicBallot').div.div.find_all('div', recursive=False)[
         1
     ]
@@ -0,0 +1,62 @@
+# pylint: disable=no-self-use
+
+import sys
+import time
+from typing import Tuple
+
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+import log
+
+
+class Command(BaseCommand):
+    help = "Compare list endpoint timings with and without fast serializers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--repeat', type=int, default=10, help="Requests timed per endpoint"
+        )
+        parser.add_argument(
+            '--limit', type=int, default=100, help="Page size of each request"
+        )
+
+    def handle(self, verbosity: int, repeat: int, limit: int, **_kwargs):
+        log.reset()
+        log.silence('datafiles')
+        log.init(verbosity=verbosity if '-v' in sys.argv[-1] else 2)
+
+        client = Client(HTTP_HOST='localhost')
+
+        for path in ['precincts', 'candidates', 'proposals', 'positions']:
+            url = f'/api/{path}/?limit={limit}'
+
+            slow_time, slow_content = self.measure(client, url, repeat, fast=False)
+            fast_time, fast_content = self.measure(client, url, repeat, fast=True)
+
+            if fast_content != slow_content:
+                log.error(f'Fast serializer output differs for {url}')
+
+            speedup = slow_time / fast_time if fast_time else 0
+            log.info(
+                f'{url}: {slow_time * 1000:.1f} ms -> {fast_time * 1000:.1f} ms '
+                f'({speedup:.1f}x faster)'
+            )
+
+    def measure(
+        self, client: Client, url: str, repeat: int, *, fast: bool
+    ) -> Tuple[float, bytes]:
+        with override_settings(API_FAST_SERIALIZERS=fast):
+            # Vary an ignored parameter so cached responses are never reused
+            marker = f'benchmark={fast}'
+            urls = [f'{url}&{marker}-{index}' for index in range(repeat)]
+
+            content = client.get(f'{url}&{marker}').content
+            content = content.replace(marker.encode(), b'benchmark')
+
+            start = time.perf_counter()
+            for uncached_url in urls:
+                client.get(uncached_url)
+            elapsed = time.perf_counter() - start
+
+        return elapsed / max(repeat, 1), content
@@ -0,0 +1,67 @@
+# pylint: disable=no-self-use
+
+import sys
+from collections import defaultdict
+from typing import DefaultDict, List
+
+from django.core.management.base import BaseCommand
+from django.db.models.functions import Length
+
+import log
+
+from elections import helpers
+from elections.models import BallotWebsite
+
+
+class Command(BaseCommand):
+    help = "Report compression savings and API response cache hit rates"
+
+    def handle(self, verbosity: int, **_kwargs):
+        log.reset()
+        log.silence('datafiles')
+        log.init(verbosity=verbosity if '-v' in sys.argv[-1] else 2)
+
+        sizes: DefaultDict[int, List[int]] = defaultdict(lambda: [0, 0, 0])
+
+        websites = (
+            BallotWebsite.objects.annotate(compressed_size=Length('mvic_html'))
+            .values_list('mvic_election_id', 'compressed_size', 'mvic_html')
+            .order_by('mvic_election_id')
+        )
+        for election_id, compressed_size, html in websites.iterator():
+            sizes[election_id][0] += 1
+            sizes[election_id][1] += len(html.encode())
+            sizes[election_id][2] += compressed_size or 0
+
+        for election_id, (count, original, compressed) in sizes.items():
+            log.info(
+                f'Election {election_id}: {count} website(s), '
+                + self.summarize(original, compressed)
+            )
+
+        count, original, compressed = [sum(s) for s in zip(*sizes.values())] or [0] * 3
+        log.info(f'Total: {count} website(s), ' + self.summarize(original, compressed))
+
+        for name in ['position', 'proposal']:
+            hits, misses = helpers.get_response_cache_stats(name)
+            total = hits + misses
+            rate = hits / total if total else 0
+            log.info(
+                f'Cached {name} lists: {hits} hit(s), {misses} miss(es) ({rate:.0%})'
+            )
+
+    def summarize(self, original: int, compressed: int) -> str:
+        saved = original - compressed
+        percent = saved / original if original else 0
+        return (
+            f'{self.format_size(original)} compressed to '
+            f'{self.format_size(compressed)}, saving {self.format_size(saved)} '
+            f'({percent:.0%})'
+        )
+
+    def format_size(self, size: float) -> str:
+        for unit in ['B', 'KB', 'MB']:
+            if abs(size) < 1024:
+                return f'{size:.1f} {unit}'
+            size /= 1024
+        return f'{size:.1f} GB'
@@ -33,6 +33,8 @@ class Command(BaseCommand):
         self.import_descriptions()
         self.export_descriptions()
 
+        helpers.bump_data_version()
+
     def update_elections(self):
         for election in Election.objects.filter(active=True):
             age = timezone.now() - timedelta(weeks=2)
@@ -9,6 +9,7 @@ from django.core.management.base import BaseCommand
 import bugsnag
 import log
 
+from elections import helpers
 from elections.commands import parse_ballots
 
 
@@ -23,14 +24,33 @@ class Command(BaseCommand):
             default=None,
             help='Michigan SOS election ID to parse ballots for.',
         )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            help='Reparse every ballot item instead of only changed ones.',
+        )
+        parser.add_argument(
+            '--workers',
+            metavar='COUNT',
+            type=int,
+            default=1,
+            help='Number of processes to parse precincts with.',
+        )
 
-    def handle(self, verbosity: int, election: Optional[int], **_kwargs):
+    def handle(
+        self,
+        verbosity: int,
+        election: Optional[int],
+        full: bool,
+        workers: int,
+        **_kwargs,
+    ):
         log.reset()
         log.silence('datafiles')
         log.init(reset=True, verbosity=verbosity if '-v' in sys.argv[-1] else 2)
 
         try:
-            parse_ballots(election_id=election)
+            parse_ballots(election_id=election, incremental=not full, workers=workers)
         except Exception as e:
             if 'HEROKU_APP_NAME' in os.environ:
                 log.error("Unable to finish parsing data", exc_info=e)
@@ -38,3 +58,5 @@ class Command(BaseCommand):
                 sys.exit(1)
             else:
                 raise e from None
+        finally:
+            helpers.bump_data_version()
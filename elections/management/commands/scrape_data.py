@@ -9,6 +9,7 @@ from django.core.management.base import BaseCommand
 import bugsnag
 import log
 
+from elections import helpers
 from elections.commands import scrape_ballots
 
 
@@ -36,6 +37,20 @@ class Command(BaseCommand):
             type=int,
             help='Maximum number of fetches to perform before stopping.',
         )
+        parser.add_argument(
+            '--workers',
+            metavar='COUNT',
+            type=int,
+            default=1,
+            help='Number of ballots to fetch concurrently.',
+        )
+        parser.add_argument(
+            '--rate-limit',
+            metavar='RPS',
+            type=float,
+            default=None,
+            help='Maximum number of requests per second to the Michigan SOS website.',
+        )
 
     def handle(
         self,
@@ -43,6 +58,8 @@ class Command(BaseCommand):
         start_election: Optional[int],
         start_precinct: int,
         ballot_limit: Optional[int],
+        workers: int,
+        rate_limit: Optional[float],
         **_kwargs,
     ):
         log.reset()
@@ -54,6 +71,8 @@ class Command(BaseCommand):
                 starting_election_id=start_election,
                 starting_precinct_id=start_precinct,
                 ballot_limit=ballot_limit,
+                workers=workers,
+                rate_limit=rate_limit,
             )
         except Exception as e:
             if 'HEROKU_APP_NAME' in os.environ:
@@ -62,3 +81,5 @@ class Command(BaseCommand):
                 sys.exit(1)
             else:
                 raise e from None
+        finally:
+            helpers.bump_data_version()
@@ -10,7 +10,7 @@ from django.db.utils import IntegrityError
 import log
 import pendulum
 
-from elections import models
+from elections import helpers, models
 
 
 class Command(BaseCommand):
@@ -25,6 +25,8 @@ class Command(BaseCommand):
         self.add_elections()
         self.fetch_districts()
 
+        helpers.bump_data_version()
+
     def get_or_create_superuser(self, username="admin", password="password"):
         User = get_user_model()
         try:
@@ -0,0 +1,37 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0056_fix_deprecations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ballotwebsite',
+            name='mvic_digest',
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, verbose_name='MVIC digest'
+            ),
+        ),
+        migrations.AddField(
+            model_name='ballotwebsite',
+            name='mvic_etag',
+            field=models.CharField(
+                blank=True, editable=False, max_length=200, verbose_name='MVIC ETag'
+            ),
+        ),
+        migrations.AddField(
+            model_name='ballotwebsite',
+            name='mvic_last_modified',
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                max_length=100,
+                verbose_name='MVIC Last-Modified',
+            ),
+        ),
+    ]
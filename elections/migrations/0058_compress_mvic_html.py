@@ -0,0 +1,25 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:24
+
+from django.db import migrations
+
+import elections.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0057_ballotwebsite_validators'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='ballotwebsite',
+            old_name='mvic_html',
+            new_name='mvic_html_text',
+        ),
+        migrations.AddField(
+            model_name='ballotwebsite',
+            name='mvic_html',
+            field=elections.fields.CompressedTextField(blank=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:24
+
+from django.db import migrations
+
+
+BATCH_SIZE = 500
+
+
+def compress_html(apps, schema_editor):
+    _copy_html(apps, 'mvic_html_text', 'mvic_html')
+
+
+def decompress_html(apps, schema_editor):
+    _copy_html(apps, 'mvic_html', 'mvic_html_text')
+
+
+def _copy_html(apps, source, target):
+    BallotWebsite = apps.get_model('elections', 'BallotWebsite')
+    websites = BallotWebsite.objects.only('id', source).order_by('id')
+
+    batch = []
+    for website in websites.iterator(chunk_size=BATCH_SIZE):
+        setattr(website, target, getattr(website, source))
+        batch.append(website)
+        if len(batch) >= BATCH_SIZE:
+            BallotWebsite.objects.bulk_update(batch, [target])
+            batch = []
+    BallotWebsite.objects.bulk_update(batch, [target])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0058_compress_mvic_html'),
+    ]
+
+    operations = [
+        migrations.RunPython(compress_html, decompress_html),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:24
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0059_compress_mvic_html_data'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='ballotwebsite',
+            name='mvic_html_text',
+        ),
+    ]
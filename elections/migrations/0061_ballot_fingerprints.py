@@ -0,0 +1,18 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0060_remove_ballotwebsite_mvic_html_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ballot',
+            name='fingerprints',
+            field=models.JSONField(default=dict, editable=False),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:12
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0061_ballot_fingerprints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BallotDocument',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'created',
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name='created',
+                    ),
+                ),
+                (
+                    'modified',
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now,
+                        editable=False,
+                        verbose_name='modified',
+                    ),
+                ),
+                ('content', models.TextField(editable=False)),
+                ('etag', models.CharField(editable=False, max_length=40)),
+                (
+                    'election',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='elections.election',
+                    ),
+                ),
+                (
+                    'precinct',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='elections.precinct',
+                    ),
+                ),
+            ],
+            options={'unique_together': {('election', 'precinct')}},
+        ),
+    ]
@@ -0,0 +1,119 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+BATCH_SIZE = 1000
+
+
+def build_index(apps, schema_editor):
+    BallotItemIndex = apps.get_model('elections', 'BallotItemIndex')
+
+    for item_type, model_name in [('position', 'Position'), ('proposal', 'Proposal')]:
+        model = apps.get_model('elections', model_name)
+        rows = model.precincts.through.objects.values_list(
+            f'{item_type}_id',
+            f'{item_type}__election_id',
+            'precinct_id',
+            'precinct__county__name',
+            'precinct__jurisdiction__name',
+            'precinct__ward',
+            'precinct__number',
+        ).order_by('id')
+
+        batch = []
+        for row in rows.iterator(chunk_size=BATCH_SIZE):
+            item_id, election_id, precinct_id, county, jurisdiction, ward, number = row
+            batch.append(
+                BallotItemIndex(
+                    election_id=election_id,
+                    precinct_id=precinct_id,
+                    item_type=item_type,
+                    item_id=item_id,
+                    county=county,
+                    jurisdiction=jurisdiction,
+                    ward=ward,
+                    number=number,
+                )
+            )
+            if len(batch) >= BATCH_SIZE:
+                BallotItemIndex.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        BallotItemIndex.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0062_ballotdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BallotItemIndex',
+            fields=[
+                (
+                    'id',
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'item_type',
+                    models.CharField(
+                        choices=[('position', 'Position'), ('proposal', 'Proposal')],
+                        max_length=8,
+                    ),
+                ),
+                ('item_id', models.PositiveIntegerField()),
+                ('county', models.CharField(max_length=100)),
+                ('jurisdiction', models.CharField(max_length=100)),
+                ('ward', models.CharField(blank=True, max_length=2)),
+                ('number', models.CharField(blank=True, max_length=3)),
+                (
+                    'election',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='elections.election',
+                    ),
+                ),
+                (
+                    'precinct',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to='elections.precinct',
+                    ),
+                ),
+            ],
+            options={
+                'verbose_name_plural': 'Ballot Item Indexes',
+                'unique_together': {('election', 'precinct', 'item_type', 'item_id')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='ballotitemindex',
+            index=models.Index(
+                fields=['item_type', 'precinct', 'item_id'],
+                name='ballot_item_index_precinct',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='ballotitemindex',
+            index=models.Index(
+                fields=[
+                    'item_type',
+                    'county',
+                    'jurisdiction',
+                    'ward',
+                    'number',
+                    'item_id',
+                ],
+                name='ballot_item_index_names',
+            ),
+        ),
+        migrations.RunPython(build_index, migrations.RunPython.noop),
+    ]
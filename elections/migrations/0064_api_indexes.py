@@ -0,0 +1,52 @@
+# Generated by Django 3.1.8 on 2026-10-17 00:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0063_ballotitemindex'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='district',
+            index=models.Index(fields=['name'], name='district_name'),
+        ),
+        migrations.AddIndex(
+            model_name='election',
+            index=models.Index(
+                condition=models.Q(active=True),
+                fields=['-date'],
+                name='election_active_date',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='ballotwebsite',
+            index=models.Index(
+                condition=models.Q(valid=True),
+                fields=['mvic_election_id', '-mvic_precinct_id'],
+                name='ballotwebsite_valid',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='position',
+            index=models.Index(fields=['name', 'id'], name='position_name_id'),
+        ),
+        migrations.AddIndex(
+            model_name='candidate',
+            index=models.Index(fields=['name', 'id'], name='candidate_name_id'),
+        ),
+        # Auto-created M2M tables can't declare indexes, so cover reverse lookups
+        migrations.RunSQL(
+            'CREATE INDEX position_precincts_reverse '
+            'ON elections_position_precincts (precinct_id, position_id);',
+            'DROP INDEX position_precincts_reverse;',
+        ),
+        migrations.RunSQL(
+            'CREATE INDEX proposal_precincts_reverse '
+            'ON elections_proposal_precincts (precinct_id, proposal_id);',
+            'DROP INDEX proposal_precincts_reverse;',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1.8 on 2026-10-17 02:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('elections', '0064_api_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ballotdocument',
+            name='data_version',
+            field=models.PositiveBigIntegerField(default=0, editable=False),
+        ),
+    ]
@@ -1,18 +1,56 @@
+# pylint: disable=too-many-lines
+
 from __future__ import annotations
 
+import hashlib
+import json
 import random
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 from django.conf import settings
-from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models, transaction
+from django.db.models import signals
+from django.dispatch import receiver
 from django.utils import timezone
+from django.utils.module_loading import import_string
 
 import bugsnag
 import log
 import pendulum
 from model_utils.models import TimeStampedModel
 
-from . import constants, exceptions, helpers
+from . import constants, exceptions, fields, helpers
+
+
+class ReferenceManager(models.Manager):
+    """Manager that memoizes lookups of rarely changing reference data."""
+
+    def __init__(self):
+        super().__init__()
+        self._cache: Dict[Tuple, Any] = {}
+
+    def get_cached(self, **kwargs):
+        key = tuple(sorted(kwargs.items()))
+        try:
+            return self._cache[key]
+        except KeyError:
+            instance = self._cache[key] = self.get(**kwargs)
+            return instance
+
+    def clear_cache(self):
+        self._cache.clear()
 
 
 class DistrictCategory(TimeStampedModel):
@@ -22,6 +60,8 @@ class DistrictCategory(TimeStampedModel):
     description = models.TextField(blank=True)
     rank = models.IntegerField(default=0, help_text="Controls ballot item ordering")
 
+    objects = ReferenceManager()
+
     class Meta:
         verbose_name_plural = "District Categories"
         ordering = ['name']
@@ -41,6 +81,46 @@ class DistrictCategory(TimeStampedModel):
         return f'{self.name} District'
 
 
+class DistrictManager(ReferenceManager):
+    def get_or_create_many(self, names: Dict[str, str]) -> List['District']:
+        """Look up a district by name for each category, creating missing ones."""
+        categories = {
+            category.name: category
+            for category in DistrictCategory.objects.filter(name__in=names)
+        }
+        for category_name in names:
+            if category_name not in categories:
+                raise DistrictCategory.DoesNotExist(
+                    f'DistrictCategory matching query does not exist: {category_name}'
+                )
+
+        categories_by_id = {category.id: category for category in categories.values()}
+
+        def find() -> Dict[str, 'District']:
+            found = {}
+            for district in self.filter(
+                category__in=categories.values(), name__in=names.values()
+            ):
+                district.category = categories_by_id[district.category_id]
+                if names[district.category.name] == district.name:
+                    found[district.category.name] = district
+            return found
+
+        districts = find()
+        missing = [
+            self.model(category=categories[category_name], name=district_name)
+            for category_name, district_name in names.items()
+            if category_name not in districts
+        ]
+        if missing:
+            self.bulk_create(missing, ignore_conflicts=True)
+            for district in missing:
+                log.info(f"Created district: {district}")
+            districts = find()
+
+        return [districts[category_name] for category_name in names]
+
+
 class District(TimeStampedModel):
     """Districts bound to ballot items."""
 
@@ -48,9 +128,12 @@ class District(TimeStampedModel):
     name = models.CharField(max_length=100)
     population = models.PositiveIntegerField(blank=True, null=True)
 
+    objects = DistrictManager()
+
     class Meta:
         unique_together = ['category', 'name']
         ordering = ['-population']
+        indexes = [models.Index(fields=['name'], name='district_name')]
 
     def __repr__(self) -> str:
         return f'<District: {self.name} ({self.category})>'
@@ -74,6 +157,13 @@ class Election(TimeStampedModel):
     class Meta:
         unique_together = ['date', 'name']
         ordering = ['-date']
+        indexes = [
+            models.Index(
+                fields=['-date'],
+                condition=models.Q(active=True),
+                name='election_active_date',
+            )
+        ]
 
     def __str__(self) -> str:
         return ' | '.join(self.mvic_name)
@@ -141,9 +231,14 @@ class Precinct(TimeStampedModel):
             ward_precinct = f"Precinct {self.number}"
         return f"{self.jurisdiction}, {ward_precinct}"
 
+    @staticmethod
+    def normalize_number(value: str) -> str:
+        """Treat an all-zero ward or precinct number as blank."""
+        return value if value.strip('0') else ''
+
     def save(self, *args, **kwargs):
-        self.ward = self.ward if self.ward.strip('0') else ''
-        self.number = self.number if self.number.strip('0') else ''
+        self.ward = self.normalize_number(self.ward)
+        self.number = self.normalize_number(self.number)
         assert self.mvic_name
         super().save(*args, **kwargs)
 
@@ -197,16 +292,26 @@ class Voter(models.Model):
         return self.birth_date.year
 
     def fetch_registration_status(
-        self, *, track_missing_data: bool = 'staging' not in settings.BASE_URL
+        self,
+        *,
+        track_missing_data: bool = 'staging' not in settings.BASE_URL,
+        refresh: bool = False,
     ) -> RegistrationStatus:
-        data = helpers.fetch_registration_status_data(self)
+        data = helpers.fetch_registration_status_data(self, refresh=refresh)
+        return self.build_registration_status(
+            data, track_missing_data=track_missing_data
+        )
 
+    def build_registration_status(
+        self,
+        data: Dict,
+        *,
+        track_missing_data: bool = 'staging' not in settings.BASE_URL,
+    ) -> RegistrationStatus:
         if not data['registered']:
             return RegistrationStatus(registered=False)
 
-        districts: List[District] = []
-        county = jurisdiction = None
-
+        names: Dict[str, str] = {}
         for category_name, district_name in sorted(data['districts'].items()):
             if not district_name:
                 log.debug(f'Skipped blank district: {category_name}')
@@ -216,19 +321,13 @@ class Voter(models.Model):
                 log.debug(f"Skipped category: {category_name}")
                 continue
 
-            category = DistrictCategory.objects.get(name=category_name)
-
-            if category.name == "County":
+            if category_name == "County":
                 district_name = district_name.replace(" County", "")
-            district, created = District.objects.get_or_create(
-                category=category, name=district_name
-            )
-            if created:
-                message = f"Created district: {district}"
-                log.info(message)
-
-            districts.append(district)
+            names[category_name] = district_name
 
+        districts = District.objects.get_or_create_many(names)
+        county = jurisdiction = None
+        for district in districts:
             if district.category.name == "County":
                 county = district
             if district.category.name == "Jurisdiction":
@@ -247,6 +346,8 @@ class Voter(models.Model):
                 jurisdiction=jurisdiction,
                 number=data['districts']['Precinct'],
             )
+        precinct.county = county
+        precinct.jurisdiction = jurisdiction
         if created:
             message = f"Created precinct: {precinct}"
             log.info(message)
@@ -291,6 +392,8 @@ class Party(TimeStampedModel):
     name = models.CharField(max_length=50, unique=True, editable=False)
     color = models.CharField(max_length=7, blank=True, editable=False)
 
+    objects = ReferenceManager()
+
     class Meta:
         verbose_name_plural = "Parties"
         ordering = ['name']
@@ -305,7 +408,16 @@ class BallotWebsite(models.Model):
     mvic_election_id = models.PositiveIntegerField(verbose_name="MVIC Election ID")
     mvic_precinct_id = models.PositiveIntegerField(verbose_name="MVIC Precinct ID")
 
-    mvic_html = models.TextField(blank=True, editable=False)
+    mvic_html: str = fields.CompressedTextField(blank=True)
+    mvic_digest = models.CharField(
+        max_length=64, blank=True, editable=False, verbose_name="MVIC digest"
+    )
+    mvic_etag = models.CharField(
+        max_length=200, blank=True, editable=False, verbose_name="MVIC ETag"
+    )
+    mvic_last_modified = models.CharField(
+        max_length=100, blank=True, editable=False, verbose_name="MVIC Last-Modified"
+    )
 
     fetched = models.BooleanField(default=False, editable=False)
     valid = models.BooleanField(null=True, editable=False)
@@ -322,6 +434,13 @@ class BallotWebsite(models.Model):
 
     class Meta:
         unique_together = ['mvic_election_id', 'mvic_precinct_id']
+        indexes = [
+            models.Index(
+                fields=['mvic_election_id', '-mvic_precinct_id'],
+                condition=models.Q(valid=True),
+                name='ballotwebsite_valid',
+            )
+        ]
 
     def __str__(self) -> str:
         return self.mvic_url
@@ -353,14 +472,56 @@ class BallotWebsite(models.Model):
 
         return weight > random.random()
 
-    def fetch(self) -> None:
-        """Fetch ballot HTML from the URL."""
-        self.mvic_html = helpers.fetch_ballot(self.mvic_url)
+    def fetch(self, *, wait: float = 0) -> bool:
+        """Fetch ballot HTML from the URL and report if it needs scraping.
+
+        While MVIC is failing, wait up to the given number of seconds for it to
+        recover instead of failing fast.
+        """
+        outdated = (
+            self.valid is None
+            or not self.last_fetch
+            or self.last_fetch < constants.SCRAPER_LAST_UPDATED
+        )
+
+        response = helpers.fetch_ballot(
+            self.mvic_url,
+            etag=self.mvic_etag if self.mvic_html else '',
+            last_modified=self.mvic_last_modified if self.mvic_html else '',
+            wait=wait,
+        )
+
+        changed = False
+        if response.status_code == 304:
+            log.info(f'Ballot HTML was not modified: {self}')
+        else:
+            html = response.text.strip()
+            digest = hashlib.sha256(html.encode()).hexdigest()
+            if digest == self.mvic_digest:
+                log.info(f'Ballot HTML is unchanged: {self}')
+            else:
+                self.mvic_html = html
+                self.mvic_digest = digest
+                changed = True
+            self.mvic_etag = response.headers.get('ETag', '')
+            self.mvic_last_modified = response.headers.get('Last-Modified', '')
 
         self.fetched = True
         self.last_fetch = timezone.now()
 
-        self.save()
+        if changed or self._state.adding:
+            self.save()
+        else:
+            self.save(
+                update_fields=[
+                    'mvic_etag',
+                    'mvic_last_modified',
+                    'fetched',
+                    'last_fetch',
+                ]
+            )
+
+        return changed or outdated
 
     def validate(self) -> bool:
         """Determine if fetched HTML contains ballot information."""
@@ -389,11 +550,12 @@ class BallotWebsite(models.Model):
         assert self.valid, f'Ballot has not been validated: {self}'
         data: Dict[str, Any] = {}
 
-        data['election'] = helpers.parse_election(self.mvic_html)
-        data['precinct'] = helpers.parse_precinct(self.mvic_html, self.mvic_url)
+        soup = helpers.build_soup(self.mvic_html)
+        data['election'] = helpers.parse_election(soup)
+        data['precinct'] = helpers.parse_precinct(soup, self.mvic_url)
         data['ballot'] = {}
 
-        data_count = helpers.parse_ballot(self.mvic_html, data['ballot'])
+        data_count = helpers.parse_ballot(soup, data['ballot'])
         log.info(f'Ballot URL contains {data_count} parsed item(s)')
         if data_count > 0:
             self.data = data
@@ -440,13 +602,14 @@ class BallotWebsite(models.Model):
         county_name, jurisdiction_name, ward, number = self.data['precinct']
 
         county, created = District.objects.get_or_create(
-            category=DistrictCategory.objects.get(name="County"), name=county_name
+            category=DistrictCategory.objects.get_cached(name="County"),
+            name=county_name,
         )
         if created:
             log.info(f'Created district: {county}')
 
         jurisdiction, created = District.objects.get_or_create(
-            category=DistrictCategory.objects.get(name="Jurisdiction"),
+            category=DistrictCategory.objects.get_cached(name="Jurisdiction"),
             name=jurisdiction_name,
         )
         if created:
@@ -454,7 +617,10 @@ class BallotWebsite(models.Model):
 
         assert self.mvic_precinct_id
         precinct, created = Precinct.objects.get_or_create(
-            county=county, jurisdiction=jurisdiction, ward=ward, number=number
+            county=county,
+            jurisdiction=jurisdiction,
+            ward=Precinct.normalize_number(ward),
+            number=Precinct.normalize_number(number),
         )
         if created:
             log.info(f'Created precinct: {precinct}')
@@ -485,6 +651,8 @@ class Ballot(TimeStampedModel):
         related_name='ballot',
     )
 
+    fingerprints = models.JSONField(default=dict, editable=False)
+
     class Meta:
         unique_together = ['election', 'precinct']
         ordering = ['election__date']
@@ -519,39 +687,134 @@ class Ballot(TimeStampedModel):
 
         return True
 
-    def parse(self) -> int:
+    def parse(self, *, incremental: bool = False) -> int:
         log.info(f'Parsing ballot: {self}')
         assert (
             self.website and self.website.data
         ), 'Ballot website has not been converted: {self}'
 
-        count = 0
-        for section_name, section_data in self.website.data['ballot'].items():
-            section_parser = getattr(self, '_parse_' + section_name.replace(' ', '_'))
-            for item in section_parser(section_data):
-                if isinstance(item, (Candidate, Proposal)):
-                    count += 1
+        writer = BallotItemWriter(self.election, self.precinct)
+        fingerprints: Dict[str, Dict] = {}
+        items: Dict[str, List[Tuple[Any, Tuple]]] = {}
 
-        self.website.parsed = True
-        self.website.last_parse = timezone.now()
-        self.website.save()
+        for key, section_name, division_data in self._iter_divisions():
+            digest = self._get_digest(division_data)
 
-        return count
+            fingerprint = self.fingerprints.get(key)
+            if incremental and fingerprint and fingerprint['digest'] == digest:
+                log.debug(f'Skipped unchanged division: {key}')
+                fingerprints[key] = fingerprint
+            else:
+                section_parser = getattr(
+                    self, '_parse_' + section_name.replace(' ', '_')
+                )
+                items[key] = list(section_parser(writer, division_data))
+                fingerprints[key] = {'digest': digest}
+
+        # Items, fingerprints, and derived rows are replaced together
+        with transaction.atomic():
+            writer.save()
+
+            for key, division_items in items.items():
+                fingerprints[key].update(
+                    count=sum(
+                        model in {Candidate, Proposal} for model, _ in division_items
+                    ),
+                    positions=[
+                        writer.positions[item].id
+                        for model, item in division_items
+                        if model is Position
+                    ],
+                    proposals=[
+                        writer.proposals[item].id
+                        for model, item in division_items
+                        if model is Proposal
+                    ],
+                )
 
-    def _parse_primary_section(self, data):
+            changed = bool(items) or fingerprints.keys() != self.fingerprints.keys()
+            self._remove_precinct(fingerprints)
+            self.fingerprints = fingerprints
+            self.save()
+
+            if changed:
+                BallotItemIndex.objects.update_ballot(
+                    self,
+                    positions={
+                        i for f in fingerprints.values() for i in f['positions']
+                    },
+                    proposals={
+                        i for f in fingerprints.values() for i in f['proposals']
+                    },
+                )
+            documents = BallotDocument.objects.filter(
+                election=self.election, precinct=self.precinct
+            )
+            if changed or not documents.exists():
+                BallotDocument.objects.materialize(self)
+
+            self.website.parsed = True
+            self.website.last_parse = timezone.now()
+            self.website.save()
+
+        return sum(fingerprint['count'] for fingerprint in fingerprints.values())
+
+    def _iter_divisions(self) -> Iterator[Tuple[str, str, Dict]]:
+        for section_name, section_data in self.website.data['ballot'].items():
+            if section_name == 'primary section':
+                for party, party_data in section_data.items():
+                    for category_name, items in party_data.items():
+                        key = f'{section_name}/{party}/{category_name}'
+                        yield key, section_name, {party: {category_name: items}}
+            else:
+                for category_name, items in section_data.items():
+                    key = f'{section_name}/{category_name}'
+                    yield key, section_name, {category_name: items}
+
+    @staticmethod
+    def _get_digest(data: Dict) -> str:
+        text = json.dumps(
+            [constants.PARSER_LAST_UPDATED.isoformat(), data], sort_keys=True
+        )
+        return hashlib.sha1(text.encode()).hexdigest()
+
+    def _remove_precinct(self, fingerprints: Dict[str, Dict]):
+        items: List[Tuple[Type[BallotItem], str]] = [
+            (Position, 'positions'),
+            (Proposal, 'proposals'),
+        ]
+        for model, label in items:
+            previous: Set[int] = set()
+            current: Set[int] = set()
+            for fingerprint in self.fingerprints.values():
+                previous.update(fingerprint[label])
+            for fingerprint in fingerprints.values():
+                current.update(fingerprint[label])
+
+            removed = previous - current
+            if removed:
+                log.info(f'Removing precinct from {len(removed)} {label}: {self}')
+                model.precincts.through.objects.filter(
+                    **{f'{model.__name__.lower()}_id__in': removed},
+                    precinct=self.precinct,
+                ).delete()
+
+    def _parse_primary_section(self, writer, data):
         for section_name, section_data in data.items():
-            yield from self._parse_partisan_section(section_data, section_name)
+            yield from self._parse_partisan_section(writer, section_data, section_name)
 
-    def _parse_partisan_section(self, data, section=''):
+    def _parse_partisan_section(self, writer, data, section=''):
         for category_name, positions_data in data.items():
             for position_data in positions_data:
 
-                category = district = None
+                district = None
 
                 if category_name in {'Presidential', 'State', 'State Board'}:
-                    district = District.objects.get(name='Michigan')
+                    district = writer.add_district(
+                        District.objects.get_cached(name='Michigan')
+                    )
                 elif category_name in {'City', 'Township'}:
-                    district = self.precinct.jurisdiction
+                    district = writer.add_district(self.precinct.jurisdiction)
                 elif category_name in {
                     'Congressional',
                     'Legislative',
@@ -568,68 +831,49 @@ class Ballot(TimeStampedModel):
 
                 if district is None:
                     if position_name in {'United States Senator'}:
-                        district = District.objects.get(name='Michigan')
+                        district = writer.add_district(
+                            District.objects.get_cached(name='Michigan')
+                        )
                     elif position_name in {'Representative in Congress'}:
-                        category = DistrictCategory.objects.get(name='US Congress')
-                        district, created = District.objects.get_or_create(
-                            category=category, name=position_data['district']
+                        district = writer.get_district(
+                            'US Congress', position_data['district']
                         )
-                        if created:
-                            log.info(f'Created district: {district}')
                     elif position_name in {'State Senator'}:
-                        category = DistrictCategory.objects.get(name='State Senate')
-                        district, created = District.objects.get_or_create(
-                            category=category, name=position_data['district']
+                        district = writer.get_district(
+                            'State Senate', position_data['district']
                         )
-                        if created:
-                            log.info(f'Created district: {district}')
                     elif position_name in {'Representative in State Legislature'}:
-                        category = DistrictCategory.objects.get(name='State House')
-                        district, created = District.objects.get_or_create(
-                            category=category, name=position_data['district']
+                        district = writer.get_district(
+                            'State House', position_data['district']
                         )
-                        if created:
-                            log.info(f'Created district: {district}')
 
                     elif position_name in {'County Commissioner'}:
-                        category = DistrictCategory.objects.get(name=position_name)
-                        district, created = District.objects.get_or_create(
-                            category=category,
-                            name=self.precinct.get_county_district_label(
+                        district = writer.get_district(
+                            position_name,
+                            self.precinct.get_county_district_label(
                                 position_data['district']
                             ),
                         )
-                        if created:
-                            log.info(f'Created district: {district}')
                     elif position_name in {'Delegate to County Convention'}:
-                        category = DistrictCategory.objects.get(name='Precinct')
-                        district, created = District.objects.get_or_create(
-                            category=category,
-                            name=self.precinct.get_precinct_label(),
+                        district = writer.get_district(
+                            'Precinct', self.precinct.get_precinct_label()
                         )
-                        if created:
-                            log.info(f'Created district: {district}')
                     elif category_name in {'County'}:
-                        district = self.precinct.county
+                        district = writer.add_district(self.precinct.county)
                     else:
                         raise exceptions.UnhandledData(
                             f'Unhandled position {position_name!r} on {self.website.mvic_url}'
                         )
 
                 default_term = constants.TERMS.get(position_data['name'], "")
-                position, created = Position.objects.get_or_create(
-                    election=self.election,
+                position = writer.get_position(
                     district=district,
                     name=position_data['name'],
                     term=position_data['term'] or default_term,
                     seats=position_data['seats'],
                     section=section,
                 )
-                if created:
-                    log.info(f'Created position: {position}')
-                position.precincts.add(self.precinct)
-                position.save()
-                yield position
+                yield Position, position
 
                 for candidate_data in position_data['candidates']:
                     candidate_name = candidate_data['name']
@@ -643,20 +887,15 @@ class Ballot(TimeStampedModel):
                             f'Expected party for {candidate_name!r} on {self.website.mvic_url}'
                         )
 
-                    party = Party.objects.get(name=candidate_data['party'])
-                    candidate, created = Candidate.objects.update_or_create(
+                    candidate = writer.get_candidate(
                         position=position,
                         name=candidate_name,
-                        defaults={
-                            'party': party,
-                            'reference_url': candidate_data['finance_link'],
-                        },
+                        party=candidate_data['party'],
+                        reference_url=candidate_data['finance_link'],
                     )
-                    if created:
-                        log.info(f'Created candidate: {candidate}')
-                    yield candidate
+                    yield Candidate, candidate
 
-    def _parse_nonpartisan_section(self, data):
+    def _parse_nonpartisan_section(self, writer, data):
         for category_name, positions_data in data.items():
             for position_data in positions_data:
 
@@ -672,14 +911,14 @@ class Ballot(TimeStampedModel):
                     if position_data['district']:
                         category = self.precinct.jurisdiction.category
                     else:
-                        district = self.precinct.jurisdiction
+                        district = writer.add_district(self.precinct.jurisdiction)
                 elif category_name in {
                     'Community College',
                     'Local School',
                     'Intermediate School',
                     'Library',
                 }:
-                    category = DistrictCategory.objects.get(name=category_name)
+                    category = writer.get_category(category_name)
                 elif category_name in {'Judicial'}:
                     pass  # district will be parsed based on position name
                 else:
@@ -692,91 +931,70 @@ class Ballot(TimeStampedModel):
                 if district is None:
                     if category is None:
                         if position_name in {'Justice of Supreme Court'}:
-                            district = District.objects.get(name='Michigan')
-                        elif position_name in {'Judge of Court of Appeals'}:
-                            category = DistrictCategory.objects.get(
-                                name='Court of Appeals'
+                            district = writer.add_district(
+                                District.objects.get_cached(name='Michigan')
                             )
+                        elif position_name in {'Judge of Court of Appeals'}:
+                            category = writer.get_category('Court of Appeals')
                         elif position_name in {'Judge of Municipal Court'}:
-                            category = DistrictCategory.objects.get(
-                                name='Municipal Court'
-                            )
+                            category = writer.get_category('Municipal Court')
                         elif position_name in {'Judge of Probate Court'}:
-                            category = DistrictCategory.objects.get(
-                                name='Probate Court'
-                            )
+                            category = writer.get_category('Probate Court')
                         elif position_name in {'Judge of Circuit Court'}:
-                            category = DistrictCategory.objects.get(
-                                name='Circuit Court'
-                            )
+                            category = writer.get_category('Circuit Court')
                         elif position_name in {'Judge of District Court'}:
-                            category = DistrictCategory.objects.get(
-                                name='District Court'
-                            )
+                            category = writer.get_category('District Court')
                         else:
                             raise exceptions.UnhandledData(
                                 f'Unhandled position {position_name!r} on {self.website.mvic_url}'
                             )
 
                     if position_data['district']:
-                        district, created = District.objects.get_or_create(
-                            category=category, name=position_data['district']
+                        district = writer.get_district(
+                            category, position_data['district']
                         )
-                        if created:
-                            log.info(f'Created district: {district}')
                     elif district is None:
                         log.warning(
                             f'Ballot {self.website.mvic_url} missing district: {position_data}'
                         )
-                        district = self.precinct.jurisdiction
+                        district = writer.add_district(self.precinct.jurisdiction)
 
                 elif position_name in {'Commissioner by Ward'}:
-                    category = DistrictCategory.objects.get(name='Ward')
-                    district, created = District.objects.get_or_create(
-                        category=category,
-                        name=self.precinct.get_ward_label(position_data['district']),
+                    district = writer.get_district(
+                        'Ward', self.precinct.get_ward_label(position_data['district'])
                     )
-                    if created:
-                        log.info(f'Created district: {district}')
 
-                position, created = Position.objects.get_or_create(
-                    election=self.election,
+                default_term = constants.TERMS.get(position_data['name'], "")
+                position = writer.get_position(
                     district=district,
                     name=position_data['name'],
-                    term=position_data['term'] or "",
+                    term=position_data['term'] or default_term,
                     seats=position_data['seats'] or 0,
+                    section="Nonpartisan",
                 )
-                if created:
-                    log.info(f'Created position: {position}')
-                position.section = "Nonpartisan"
-                position.precincts.add(self.precinct)
-                position.save()
-                yield position
+                yield Position, position
 
                 for candidate_data in position_data['candidates']:
                     assert candidate_data['party'] is None
-                    party = Party.objects.get(name="Nonpartisan")
-                    candidate, created = Candidate.objects.update_or_create(
+                    candidate = writer.get_candidate(
                         position=position,
                         name=candidate_data['name'],
-                        defaults={
-                            'party': party,
-                            'reference_url': candidate_data['finance_link'],
-                        },
+                        party="Nonpartisan",
+                        reference_url=candidate_data['finance_link'],
                     )
-                    if created:
-                        log.info(f'Created candidate: {candidate}')
-                    yield candidate
+                    yield Candidate, candidate
 
-    def _parse_proposal_section(self, data):
+    def _parse_proposal_section(self, writer, data):
         for category_name, proposals_data in data.items():
 
             category = district = None
 
             if category_name in {'State'}:
-                district = District.objects.get(name='Michigan')
+                district = writer.add_district(
+                    District.objects.get_cached(name='Michigan')
+                )
             elif category_name in {'County'}:
-                district = self.precinct.county
+                district = writer.add_district(self.precinct.county)
             elif category_name in {
                 'City',
                 'Township',
@@ -786,13 +1004,13 @@ class Ballot(TimeStampedModel):
                 'Metropolitan',
             }:
                 # TODO: Verify this is the correct mapping for 'Local School'
-                district = self.precinct.jurisdiction
+                district = writer.add_district(self.precinct.jurisdiction)
             elif category_name in {
                 'Community College',
                 'Intermediate School',
                 'District Library',
             }:
-                category = DistrictCategory.objects.get(name=category_name)
+                category = writer.get_category(category_name)
             else:
                 raise exceptions.UnhandledData(
                     f'Unhandled category {category_name!r} on {self.website.mvic_url}'
@@ -842,28 +1060,19 @@ class Ballot(TimeStampedModel):
                     else:
                         raise original_exception  # type: ignore
 
-                    district, created = District.objects.get_or_create(
-                        category=category, name=district_name
-                    )
-                    if created:
-                        log.info(f'Created district: {district}')
+                    district = writer.get_district(category, district_name)
 
                 if proposal_data['text'] is None:
                     raise exceptions.MissingData(
                         f'Proposal text missing on {self.website.mvic_url}'
                     )
 
-                proposal, created = Proposal.objects.update_or_create(
-                    election=self.election,
+                proposal = writer.get_proposal(
                     district=district,
                     name=proposal_data['title'],
-                    defaults={'description': proposal_data['text']},
+                    description=proposal_data['text'],
                 )
-                if created:
-                    log.info(f'Created proposal: {proposal}')
-                proposal.precincts.add(self.precinct)
-                proposal.save()
-                yield proposal
+                yield Proposal, proposal
 
 
 class BallotItem(TimeStampedModel):
@@ -908,6 +1117,7 @@ class Position(BallotItem):
             'seats',
         ]
         ordering = ['name', 'seats']
+        indexes = [models.Index(fields=['name', 'id'], name='position_name_id')]
 
     def __str__(self):
         if self.term:
@@ -938,6 +1148,401 @@ class Candidate(TimeStampedModel):
     class Meta:
         unique_together = ['position', 'name']
         ordering = ['name']
+        indexes = [models.Index(fields=['name', 'id'], name='candidate_name_id')]
 
     def __str__(self) -> str:
         return f'{self.name} for {self.position}'
+
+
+class BallotDocumentManager(models.Manager):
+
+    # Named by path because the serializers depend on this module
+    serializer_class = 'elections.serializers.BallotDocumentSerializer'
+
+    def materialize(self, ballot: Ballot) -> BallotDocument:
+        """Serialize a ballot with all of its items for single-lookup reads."""
+        # Read first so that changes made while serializing trigger a rebuild
+        version = helpers.get_data_version()
+
+        serializer_class = import_string(self.serializer_class)
+        data = serializer_class(ballot, context={'request': None}).data
+        content = json.dumps(data, cls=DjangoJSONEncoder)
+        etag = hashlib.sha1(content.encode()).hexdigest()
+
+        document, created = self.get_or_create(
+            election=ballot.election,
+            precinct=ballot.precinct,
+            defaults={'content': content, 'etag': etag, 'data_version': version},
+        )
+        if not created and document.etag != etag:
+            log.info(f'Updating ballot document: {ballot}')
+            document.content = content
+            document.etag = etag
+            document.data_version = version
+            document.save()
+        elif not created and document.data_version != version:
+            # Keep the modification time of unchanged content
+            self.filter(pk=document.pk).update(data_version=version)
+            document.data_version = version
+
+        return document
+
+    def refresh(self, document: BallotDocument) -> BallotDocument:
+        """Rebuild a document if any data was changed since it was serialized."""
+        if document.data_version == helpers.get_data_version():
+            return document
+        ballot = Ballot.objects.select_related('election', 'precinct').get(
+            election_id=document.election_id, precinct_id=document.precinct_id
+        )
+        return self.materialize(ballot)
+
+
+class BallotDocument(TimeStampedModel):
+    """Pre-serialized ballot with its positions and proposals."""
+
+    election = models.ForeignKey(Election, on_delete=models.CASCADE)
+    precinct = models.ForeignKey(Precinct, on_delete=models.CASCADE)
+
+    content = models.TextField(editable=False)
+    etag = models.CharField(max_length=40, editable=False)
+    data_version = models.PositiveBigIntegerField(default=0, editable=False)
+
+    objects = BallotDocumentManager()
+
+    class Meta:
+        unique_together = ['election', 'precinct']
+
+    def __str__(self) -> str:
+        return f'{self.election} | {self.precinct}'
+
+
+class BallotItemIndexManager(models.Manager):
+    def update_ballot(
+        self, ballot: Ballot, *, positions: Set[int], proposals: Set[int]
+    ):
+        """Match a ballot's index rows to the items it currently lists."""
+        current = {('position', i) for i in positions} | {
+            ('proposal', i) for i in proposals
+        }
+        existing = set(
+            self.filter(election=ballot.election, precinct=ballot.precinct).values_list(
+                'item_type', 'item_id'
+            )
+        )
+
+        removed = existing - current
+        for item_type in {item_type for item_type, _ in removed}:
+            self.filter(
+                election=ballot.election,
+                precinct=ballot.precinct,
+                item_type=item_type,
+                item_id__in={i for t, i in removed if t == item_type},
+            ).delete()
+
+        added = current - existing
+        if added:
+            log.debug(f'Indexing {len(added)} ballot item(s): {ballot}')
+            precinct = ballot.precinct
+            self.bulk_create(
+                [
+                    self.model(
+                        election=ballot.election,
+                        precinct=precinct,
+                        item_type=item_type,
+                        item_id=item_id,
+                        county=precinct.county.name,
+                        jurisdiction=precinct.jurisdiction.name,
+                        ward=precinct.ward,
+                        number=precinct.number,
+                    )
+                    for item_type, item_id in sorted(added)
+                ],
+                ignore_conflicts=True,
+            )
+
+
+class BallotItemIndex(models.Model):
+    """Denormalized lookup of ballot items by precinct, maintained by parsing."""
+
+    ITEM_TYPES = [('position', "Position"), ('proposal', "Proposal")]
+
+    election = models.ForeignKey(Election, on_delete=models.CASCADE)
+    precinct = models.ForeignKey(Precinct, on_delete=models.CASCADE)
+
+    item_type = models.CharField(max_length=8, choices=ITEM_TYPES)
+    item_id = models.PositiveIntegerField()
+
+    county = models.CharField(max_length=100)
+    jurisdiction = models.CharField(max_length=100)
+    ward = models.CharField(max_length=2, blank=True)
+    number = models.CharField(max_length=3, blank=True)
+
+    objects = BallotItemIndexManager()
+
+    class Meta:
+        verbose_name_plural = "Ballot Item Indexes"
+        unique_together = ['election', 'precinct', 'item_type', 'item_id']
+        indexes = [
+            models.Index(
+                fields=['item_type', 'precinct', 'item_id'],
+                name='ballot_item_index_precinct',
+            ),
+            models.Index(
+                fields=[
+                    'item_type',
+                    'county',
+                    'jurisdiction',
+                    'ward',
+                    'number',
+                    'item_id',
+                ],
+                name='ballot_item_index_names',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f'{self.item_type} {self.item_id} | {self.precinct_id}'
+
+
+class BallotItemWriter:
+    """Collect a ballot's items to save them with a few bulk queries."""
+
+    def __init__(self, election: Election, precinct: Precinct):
+        self.election = election
+        self.precinct = precinct
+
+        # Saved instances are available by key once the writer is saved
+        self.districts: Dict[Tuple, District] = {}
+        self.positions: Dict[Tuple, Position] = {}
+        self.proposals: Dict[Tuple, Proposal] = {}
+
+        self.missing_districts: Set[Tuple] = set()
+        self.position_keys: Set[Tuple] = set()
+        self.candidates: Dict[Tuple, Dict] = {}
+        self.descriptions: Dict[Tuple, str] = {}
+
+    @staticmethod
+    def get_category(name: str) -> DistrictCategory:
+        return DistrictCategory.objects.get_cached(name=name)
+
+    def add_district(self, district: District) -> Tuple:
+        key = (district.category_id, district.name)
+        self.districts[key] = district
+        self.missing_districts.discard(key)
+        return key
+
+    def get_district(self, category, name: str) -> Tuple:
+        if isinstance(category, str):
+            category = self.get_category(category)
+        key = (category.id, name)
+        if key not in self.districts:
+            self.missing_districts.add(key)
+        return key
+
+    def get_position(
+        self, *, district: Tuple, name: str, term: str, seats: int, section: str
+    ) -> Tuple:
+        key = (district, name, term, seats, section)
+        self.position_keys.add(key)
+        return key
+
+    def get_candidate(
+        self, *, position: Tuple, name: str, party: str, reference_url: Optional[str]
+    ) -> Tuple:
+        key = (position, name)
+        self.candidates[key] = {'party': party, 'reference_url': reference_url}
+        return key
+
+    def get_proposal(self, *, district: Tuple, name: str, description: str) -> Tuple:
+        key = (district, name)
+        self.descriptions[key] = description
+        return key
+
+    def save(self):
+        """Save all collected items, which must be done in a transaction."""
+        self._save_districts()
+        self._save_positions()
+        self._save_candidates()
+        self._save_proposals()
+
+    def _save_districts(self):
+        missing = list(self.missing_districts)
+        if not missing:
+            return
+
+        existing = District.objects.filter(
+            category__in={category_id for category_id, _name in missing},
+            name__in={name for _category_id, name in missing},
+        )
+        districts = self._bulk_get_or_create(
+            existing,
+            missing,
+            lambda district: (district.category_id, district.name),
+            lambda key: District(category_id=key[0], name=key[1]),
+        )
+        self.districts.update(districts)
+        self.missing_districts.clear()
+
+    def _save_positions(self):
+        if not self.position_keys:
+            return
+
+        existing = Position.objects.filter(
+            election=self.election,
+            district__in={d.id for d in self.districts.values()},
+            name__in={name for _district, name, *_ in self.position_keys},
+        )
+        district_keys = {d.id: key for key, d in self.districts.items()}
+        positions = self._bulk_get_or_create(
+            existing,
+            list(self.position_keys),
+            lambda position: (
+                district_keys.get(position.district_id),
+                position.name,
+                position.term,
+                position.seats,
+                position.section,
+            ),
+            lambda key: Position(
+                election=self.election,
+                district=self.districts[key[0]],
+                name=key[1],
+                term=key[2],
+                seats=key[3],
+                section=key[4],
+            ),
+        )
+        self.positions.update(positions)
+        self._add_precinct(Position, positions.values())
+
+    def _save_candidates(self):
+        if not self.candidates:
+            return
+
+        position_keys = {p.id: key for key, p in self.positions.items()}
+        candidates: Dict[Tuple, Candidate] = {
+            (position_keys.get(c.position_id), c.name): c
+            for c in Candidate.objects.filter(
+                position__in=[p.id for p in self.positions.values()]
+            )
+        }
+
+        created, updated = [], []
+        for key, values in sorted(self.candidates.items()):
+            party = Party.objects.get_cached(name=values['party'])
+            reference_url = values['reference_url']
+            candidate = candidates.get(key)
+            if candidate is None:
+                created.append(
+                    Candidate(
+                        position=self.positions[key[0]],
+                        name=key[1],
+                        party=party,
+                        reference_url=reference_url,
+                    )
+                )
+            elif (
+                candidate.party_id != party.id
+                or candidate.reference_url != reference_url
+            ):
+                candidate.party = party
+                candidate.reference_url = reference_url
+                candidate.modified = timezone.now()
+                updated.append(candidate)
+
+        if created:
+            Candidate.objects.bulk_create(created, ignore_conflicts=True)
+            saved = Candidate.objects.filter(
+                position__in={c.position_id for c in created},
+                name__in={c.name for c in created},
+            )
+            self._log_created(
+                created,
+                saved,
+                lambda candidate: (candidate.position_id, candidate.name),
+            )
+        Candidate.objects.bulk_update(
+            sorted(updated, key=lambda c: c.id), ['party', 'reference_url', 'modified']
+        )
+
+    def _save_proposals(self):
+        if not self.descriptions:
+            return
+
+        existing = Proposal.objects.filter(
+            election=self.election,
+            district__in={d.id for d in self.districts.values()},
+            name__in={name for _district, name in self.descriptions},
+        )
+        district_keys = {d.id: key for key, d in self.districts.items()}
+        proposals = self._bulk_get_or_create(
+            existing,
+            list(self.descriptions),
+            lambda proposal: (district_keys.get(proposal.district_id), proposal.name),
+            lambda key: Proposal(
+                election=self.election,
+                district=self.districts[key[0]],
+                name=key[1],
+                description=self.descriptions[key],
+            ),
+        )
+        self.proposals.update(proposals)
+
+        updated = []
+        for key, proposal in proposals.items():
+            if proposal.description != self.descriptions[key]:
+                proposal.description = self.descriptions[key]
+                proposal.modified = timezone.now()
+                updated.append(proposal)
+        Proposal.objects.bulk_update(
+            sorted(updated, key=lambda p: p.id), ['description', 'modified']
+        )
+
+        self._add_precinct(Proposal, proposals.values())
+
+    @classmethod
+    def _bulk_get_or_create(
+        cls,
+        queryset: models.QuerySet,
+        keys: List[Tuple],
+        get_key: Callable[[Any], Tuple],
+        build: Callable[[Tuple], Any],
+    ) -> Dict[Tuple, Any]:
+        instances = {get_key(instance): instance for instance in queryset}
+        # Sorted so concurrent parsers lock conflicting rows in the same order
+        missing = [build(key) for key in sorted(keys) if key not in instances]
+        if missing:
+            queryset.model.objects.bulk_create(missing, ignore_conflicts=True)
+            # Conflicting rows are skipped without primary keys, so requery
+            saved = list(queryset.all())
+            cls._log_created(missing, saved, get_key)
+            instances = {get_key(instance): instance for instance in saved}
+        return {key: instances[key] for key in keys}
+
+    @staticmethod
+    def _log_created(
+        built: List[Any], saved: Iterable[Any], get_key: Callable[[Any], Tuple]
+    ):
+        # Rows skipped as conflicts keep the creation time of another parser
+        created = {get_key(instance): instance.created for instance in saved}
+        for instance in built:
+            if created.get(get_key(instance)) == instance.created:
+                log.info(f'Created {instance._meta.verbose_name}: {instance}')
+
+    def _add_precinct(self, model, instances):
+        through = model.precincts.through
+        field = model._meta.model_name + '_id'
+        through.objects.bulk_create(
+            [
+                through(**{field: instance.id, 'precinct_id': self.precinct.id})
+                for instance in instances
+            ],
+            ignore_conflicts=True,
+        )
+
+
+@receiver([signals.post_save, signals.post_delete], sender=DistrictCategory)
+@receiver([signals.post_save, signals.post_delete], sender=District)
+@receiver([signals.post_save, signals.post_delete], sender=Party)
+def clear_reference_cache(sender, **_kwargs):
+    sender.objects.clear_cache()
@@ -0,0 +1,167 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, List, Optional, Sequence
+
+from django.db.models import Q
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import LimitOffsetPagination, coreapi, coreschema
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination that can also page by key and skip counting.
+
+    Passing `cursor` (empty for the first page) orders results by the view's
+    `cursor_ordering` and starts each page after the last key of the previous
+    one, so deep pages cost the same as the first. Passing `count=false` skips
+    the COUNT query, which cursor pages never run.
+    """
+
+    cursor_query_param = 'cursor'
+    cursor_query_description = (
+        "Page by key instead of offset. Leave empty for the first page, "
+        "then follow the `next` link."
+    )
+    count_query_param = 'count'
+    count_query_description = "Include the total number of results. Defaults to true."
+    invalid_cursor_message = "Invalid cursor"
+
+    def __init__(self):
+        self.cursor: Optional[str] = None
+        self.ordering: Sequence[str] = ()
+        self.limit = 0
+        self.offset = 0
+        self.count: Optional[int] = None
+        self.request: Any = None
+        self.has_next = False
+        self.results: List = []
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor = request.query_params.get(self.cursor_query_param)
+        if self.cursor is None and self.should_count(request):
+            self.display_page_controls = True
+            return super().paginate_queryset(queryset, request, view)
+
+        limit = self.get_limit(request)
+        if limit is None:
+            return None
+
+        self.limit = limit
+        self.request = request
+        self.count = None
+        self.display_page_controls = False
+
+        if self.cursor is None:
+            self.offset = self.get_offset(request)
+        else:
+            self.offset = 0
+            self.ordering = view.cursor_ordering
+            queryset = queryset.order_by(*self.ordering)
+            if self.cursor:
+                try:
+                    queryset = queryset.filter(self.get_keyset_filter(self.cursor))
+                except (TypeError, ValueError):
+                    raise NotFound(self.invalid_cursor_message) from None
+
+        # Fetch one extra row to find out whether there is a next page
+        results = list(queryset[self.offset : self.offset + self.limit + 1])
+        self.has_next = len(results) > self.limit
+        self.results = results[: self.limit]
+        return self.results
+
+    def should_count(self, request) -> bool:
+        value = request.query_params.get(self.count_query_param, '')
+        return value.lower() not in {'false', '0'}
+
+    def get_next_link(self) -> Optional[str]:
+        if self.count is not None:
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        if self.cursor is None:
+            offset = self.offset + self.limit
+            return replace_query_param(url, self.offset_query_param, offset)
+
+        last = self.results[-1]
+        cursor = self.encode_cursor([self.get_key(last, f) for f in self.ordering])
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_previous_link(self) -> Optional[str]:
+        if self.cursor is not None:
+            return None
+        return super().get_previous_link()
+
+    def get_keyset_filter(self, cursor: str) -> Q:
+        values = self.decode_cursor(cursor)
+        if len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        # (a, b) > (x, y) is equivalent to a > x OR (a = x AND b > y)
+        query = Q()
+        for index, field in enumerate(self.ordering):
+            equal = dict(zip(self.ordering[:index], values))
+            query |= Q(**equal, **{f'{field}__gt': values[index]})
+        return query
+
+    @staticmethod
+    def get_key(item, field: str) -> Any:
+        if isinstance(item, dict):
+            return item[field]
+        return getattr(item, field)
+
+    @staticmethod
+    def encode_cursor(values: Sequence) -> str:
+        data = json.dumps(list(values), separators=(',', ':')).encode()
+        return urlsafe_b64encode(data).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> List:
+        try:
+            data = urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(data)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message) from None
+        if not isinstance(values, list):
+            raise NotFound(self.invalid_cursor_message)
+        return values
+
+    def get_schema_fields(self, view):
+        return super().get_schema_fields(view) + [
+            coreapi.Field(
+                name=self.cursor_query_param,
+                required=False,
+                location='query',
+                schema=coreschema.String(
+                    title='Cursor', description=str(self.cursor_query_description)
+                ),
+            ),
+            coreapi.Field(
+                name=self.count_query_param,
+                required=False,
+                location='query',
+                schema=coreschema.Boolean(
+                    title='Count', description=str(self.count_query_description)
+                ),
+            ),
+        ]
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(self.cursor_query_description),
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': str(self.count_query_description),
+                'schema': {'type': 'boolean'},
+            },
+        ]
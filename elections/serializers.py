@@ -1,7 +1,11 @@
 # pylint: disable=no-self-use
 
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
 import pendulum
 from rest_framework import serializers
+from rest_framework.reverse import reverse
 
 from . import fields, models
 
@@ -151,6 +155,37 @@ class PositionSerializer(serializers.HyperlinkedModelSerializer):
         return f'https://github.com/citizenlabsgr/elections-api/edit/main/content/{category}/{name}.md'
 
 
+class BallotDocumentSerializer(BallotSerializer):
+
+    positions = serializers.SerializerMethodField()
+    proposals = serializers.SerializerMethodField()
+
+    class Meta:
+        model = models.Ballot
+        fields = BallotSerializer.Meta.fields + ['positions', 'proposals']
+
+    def get_positions(self, instance):
+        positions = (
+            models.Position.objects.filter(
+                election=instance.election, precincts=instance.precinct
+            )
+            .select_related('election', 'district__category')
+            .prefetch_related('candidates__party')
+            .order_by('district__category__rank', 'name')
+        )
+        return PositionSerializer(positions, many=True, context=self.context).data
+
+    def get_proposals(self, instance):
+        proposals = (
+            models.Proposal.objects.filter(
+                election=instance.election, precincts=instance.precinct
+            )
+            .select_related('election', 'district__category')
+            .order_by('district__category__rank', 'name')
+        )
+        return ProposalSerializer(proposals, many=True, context=self.context).data
+
+
 class RegistrationStatusSerializer(serializers.HyperlinkedModelSerializer):
 
     precinct = PrecinctSerializer()
@@ -193,3 +228,185 @@ class GlossarySerializer(serializers.Serializer):  # pylint: disable=abstract-me
         category = self.get_category(instance)
         name = instance.name.replace(' ', '%20')
         return f'https://github.com/citizenlabsgr/elections-api/edit/main/content/{category}/{name}.md'
+
+
+class ValuesSerializer(ABC):
+    """Build a model serializer's output from `.values()` rows, skipping DRF fields."""
+
+    fields: List[str] = []
+
+    def __init__(self, context: Dict):
+        self.context = context
+        self._urls: Dict[str, str] = {}
+        self._categories: Dict[str, str] = {}
+        self._elections: Dict[int, Dict] = {}
+        self._parties: Dict[int, Dict] = {}
+
+    def to_representation(self, rows: Iterable[Dict]) -> List[Dict]:
+        return [self.serialize(row) for row in rows]
+
+    @abstractmethod
+    def serialize(self, row: Dict) -> Dict:
+        """Build the response data for one row of `.values()` output."""
+
+    def get_url(self, view_name: str, pk: int) -> str:
+        if view_name not in self._urls:
+            url = reverse(view_name, kwargs={'pk': 0}, request=self.context['request'])
+            self._urls[view_name] = url[: -len('0/')]
+        return f'{self._urls[view_name]}{pk}/'
+
+    def get_district(self, row: Dict) -> Optional[Dict]:
+        pk = row['district_id']
+        if pk is None:
+            return None
+
+        category_name = row['district__category__name']
+        if category_name not in self._categories:
+            category = models.DistrictCategory(name=category_name)
+            self._categories[category_name] = str(category)
+
+        return {
+            'url': self.get_url('district-detail', pk),
+            'id': pk,
+            'category': self._categories[category_name],
+            'name': row['district__name'],
+        }
+
+    def get_election(self, row: Dict) -> Dict:
+        pk = row['election_id']
+        if pk not in self._elections:
+            election = models.Election(
+                id=pk,
+                name=row['election__name'],
+                date=row['election__date'],
+                description=row['election__description'],
+                active=row['election__active'],
+                reference_url=row['election__reference_url'],
+            )
+            serializer = ElectionSerializer(election, context=self.context)
+            self._elections[pk] = serializer.data
+        return self._elections[pk]
+
+    def get_party(self, row: Dict) -> Optional[Dict]:
+        pk = row['party_id']
+        if pk is None:
+            return None
+        if pk not in self._parties:
+            party = models.Party(
+                id=pk, name=row['party__name'], color=row['party__color']
+            )
+            self._parties[pk] = PartySerializer(party, context=self.context).data
+        return self._parties[pk]
+
+
+ELECTION_VALUES = [
+    'election_id',
+    'election__name',
+    'election__date',
+    'election__description',
+    'election__active',
+    'election__reference_url',
+]
+
+DISTRICT_VALUES = ['district_id', 'district__name', 'district__category__name']
+
+
+class PrecinctValuesSerializer(ValuesSerializer):
+
+    fields = ['id', 'county__name', 'jurisdiction__name', 'ward', 'number']
+
+    def serialize(self, row: Dict) -> Dict:
+        return {
+            'url': self.get_url('precinct-detail', row['id']),
+            'id': row['id'],
+            'county': row['county__name'],
+            'jurisdiction': row['jurisdiction__name'],
+            'ward': row['ward'] or None,
+            'number': row['number'] or None,
+        }
+
+
+class CandidateValuesSerializer(ValuesSerializer):
+
+    fields = [
+        'id',
+        'name',
+        'description',
+        'reference_url',
+        'party_id',
+        'party__name',
+        'party__color',
+    ]
+
+    def serialize(self, row: Dict) -> Dict:
+        return {
+            'url': self.get_url('candidate-detail', row['id']),
+            'id': row['id'],
+            'name': row['name'],
+            'description': row['description'],
+            'reference_url': row['reference_url'],
+            'party': self.get_party(row),
+        }
+
+
+class ProposalValuesSerializer(ValuesSerializer):
+
+    fields = ['id', 'name', 'description', 'reference_url'] + (
+        ELECTION_VALUES + DISTRICT_VALUES
+    )
+
+    def serialize(self, row: Dict) -> Dict:
+        return {
+            'url': self.get_url('proposal-detail', row['id']),
+            'id': row['id'],
+            'name': row['name'],
+            'description': row['description'],
+            'reference_url': row['reference_url'],
+            'election': self.get_election(row),
+            'district': self.get_district(row),
+        }
+
+
+class PositionValuesSerializer(ValuesSerializer):
+
+    fields = [
+        'id',
+        'name',
+        'description',
+        'reference_url',
+        'section',
+        'seats',
+        'term',
+    ] + (ELECTION_VALUES + DISTRICT_VALUES)
+
+    def to_representation(self, rows: Iterable[Dict]) -> List[Dict]:
+        rows = list(rows)
+
+        candidates: Dict[int, List[Dict]] = {row['id']: [] for row in rows}
+        serializer = CandidateValuesSerializer(self.context)
+        for row in models.Candidate.objects.filter(position__in=candidates).values(
+            'position_id', *serializer.fields
+        ):
+            candidates[row['position_id']].append(serializer.serialize(row))
+
+        return [
+            dict(self.serialize(row), candidates=candidates[row['id']]) for row in rows
+        ]
+
+    def serialize(self, row: Dict) -> Dict:
+        category = 'positions'
+        name = row['name'].replace(' ', '%20')
+        return {
+            'url': self.get_url('position-detail', row['id']),
+            'id': row['id'],
+            'name': row['name'],
+            'description': row['description'],
+            'description_edit_url': f'https://github.com/citizenlabsgr/elections-api/edit/main/content/{category}/{name}.md',
+            'reference_url': row['reference_url'],
+            'section': row['section'],
+            'seats': row['seats'],
+            'term': row['term'],
+            'candidates': [],
+            'election': self.get_election(row),
+            'district': self.get_district(row),
+        }
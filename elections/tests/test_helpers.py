@@ -1,12 +1,18 @@
 # pylint: disable=unused-variable
 
 
+import asyncio
 import datetime
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.cache import cache
 
 import pendulum
 import pytest
 
-from .. import helpers, models
+from .. import exceptions, helpers, models
 
 
 @pytest.fixture
@@ -19,6 +25,24 @@ def voter():
     )
 
 
+def describe_mvic_session():
+    def it_reuses_one_session(expect):
+        with helpers.mvic_session() as session1:
+            pass
+        with helpers.mvic_session() as session2:
+            pass
+
+        expect(session1).is_(session2)
+
+    def it_pools_connections_to_mvic(expect, settings):
+        with helpers.mvic_session() as session:
+            adapter = session.get_adapter(helpers.MVIC_URL)
+
+        pool_kwargs = adapter.poolmanager.connection_pool_kw
+        expect(pool_kwargs['maxsize']) == settings.MVIC_POOL_SIZE
+        expect(adapter.max_retries.total) == settings.MVIC_RETRIES
+
+
 def describe_fetch_registration_status_data():
     @pytest.mark.vcr
     def with_known_voter(expect, voter):
@@ -65,3 +89,278 @@ def describe_fetch_registration_status_data():
             ],
             "recently_moved": False,
         }
+
+    def describe_caching():
+        @pytest.fixture
+        def lookups(monkeypatch):
+            lookups = []
+
+            def fetch(voter):
+                lookups.append(voter)
+                return {"registered": len(lookups) > 1}
+
+            monkeypatch.setattr(helpers, '_fetch_registration_status_data', fetch)
+            return lookups
+
+        def it_reuses_recent_results(expect, voter, lookups):
+            helpers.fetch_registration_status_data(voter)
+            data = helpers.fetch_registration_status_data(voter)
+
+            expect(data) == {"registered": False}
+            expect(len(lookups)) == 1
+
+        def it_can_bypass_the_cache(expect, voter, lookups):
+            helpers.fetch_registration_status_data(voter)
+            data = helpers.fetch_registration_status_data(voter, refresh=True)
+
+            expect(data) == {"registered": True}
+            expect(len(lookups)) == 2
+
+        def it_expires_negative_results_separately(expect, voter, lookups, settings):
+            settings.REGISTRATION_CACHE_NEGATIVE_TIMEOUT = 0
+            helpers.fetch_registration_status_data(voter)
+            data = helpers.fetch_registration_status_data(voter)
+
+            expect(data) == {"registered": True}
+            expect(len(lookups)) == 2
+
+        def it_waits_on_lookups_in_other_workers(expect, voter, lookups):
+            key = helpers.build_registration_cache_key(voter)
+            cache.set(key + ':lock', True)
+
+            def finish():
+                cache.set(key, {"registered": False})
+                cache.delete(key + ':lock')
+
+            threading.Timer(0.2, finish).start()
+            data = helpers.fetch_registration_status_data(voter)
+
+            expect(data) == {"registered": False}
+            expect(len(lookups)) == 0
+
+        def it_keeps_locks_taken_over_by_other_workers(expect, voter, monkeypatch):
+            key = helpers.build_registration_cache_key(voter)
+
+            def fetch(_voter):
+                # The lock expired and another worker took it over
+                cache.set(key + ':lock', 42)
+                return {"registered": True}
+
+            monkeypatch.setattr(helpers, '_fetch_registration_status_data', fetch)
+            helpers.fetch_registration_status_data(voter)
+
+            expect(cache.get(key + ':lock')) == 42
+
+        def it_hides_voter_details_in_keys(expect, voter):
+            key = helpers.build_registration_cache_key(voter)
+
+            expect(key).startswith('registration:')
+            expect(key).excludes('Bliss')
+            expect(key) == helpers.build_registration_cache_key(
+                models.Voter(
+                    first_name=" rosalynn",
+                    last_name="BLISS",
+                    birth_date=datetime.date(1975, 8, 3),
+                    zip_code="49503",
+                )
+            )
+
+
+def describe_fetch_registration_status_data_async():
+    @pytest.fixture
+    def lookups(monkeypatch):
+        lookups = []
+
+        async def fetch(voter, _key):
+            lookups.append(voter)
+            await asyncio.sleep(0.1)
+            return {"registered": False}
+
+        monkeypatch.setattr(helpers, '_fetch_registration_status_data_async', fetch)
+        return lookups
+
+    def it_shares_concurrent_lookups(expect, voter, lookups):
+        async def lookup_many():
+            return await asyncio.gather(
+                *[helpers.fetch_registration_status_data_async(voter) for _ in range(3)]
+            )
+
+        results = asyncio.run(lookup_many())
+
+        expect(results) == [{"registered": False}] * 3
+        expect(len(lookups)) == 1
+
+
+def describe_parse_precinct():
+    @pytest.fixture
+    def soup():
+        return helpers.build_soup(
+            """
+            <p>Ottawa County, Michigan</p>
+            <div id="PreviewMvicBallot"><div><div><div class="text-center">
+                STATE GENERAL<br/>
+                Tuesday, November 3, 2020
+                <br class="d-md-none"/>
+                Kent County, Michigan
+                <br class="d-lg-none"/>
+                CITY OF GRAND RAPIDS, Ward 2 Precinct 30
+            </div></div></div></div>
+            """
+        )
+
+    def it_reads_the_header(expect, soup):
+        expect(helpers.parse_election(soup)) == ("State General", (2020, 11, 3))
+        expect(helpers.parse_precinct(soup, "")) == (
+            "Kent",
+            "City of Grand Rapids",
+            "2",
+            "30",
+        )
+
+
+def describe_circuit_breaker():
+    def _fail(breaker):
+        with pytest.raises(exceptions.ServiceUnavailable):
+            with breaker.guard():
+                raise exceptions.ServiceUnavailable()
+
+    def it_fails_fast_after_repeated_failures(expect):
+        breaker = helpers.CircuitBreaker('test', 2, 10, 60)
+        _fail(breaker)
+        expect(breaker.state) == 'closed'
+        _fail(breaker)
+        expect(breaker.state) == 'open'
+
+        calls = []
+        with pytest.raises(exceptions.ServiceUnavailable):
+            with breaker.guard():
+                calls.append(1)
+
+        expect(calls) == []
+
+    def it_lets_one_probe_through_after_cooling_down(expect):
+        breaker = helpers.CircuitBreaker('test', 1, 0.01, 0.01)
+        _fail(breaker)
+        time.sleep(0.02)
+
+        expect(breaker.state) == 'half-open'
+        token = breaker.acquire()
+        assert token is not None
+        expect(breaker.acquire()) == None
+
+        breaker.record_success(token)
+        expect(breaker.state) == 'closed'
+
+    def it_backs_off_longer_after_failed_probes(expect):
+        breaker = helpers.CircuitBreaker('test', 1, 0.1, 60)
+        _fail(breaker)
+        time.sleep(0.11)
+        _fail(breaker)
+        time.sleep(0.09)
+
+        expect(breaker.state) == 'open'
+
+    def it_can_wait_for_the_circuit_to_close(expect):
+        breaker = helpers.CircuitBreaker('test', 1, 0.2, 0.2)
+        _fail(breaker)
+
+        start = time.monotonic()
+        with breaker.guard(wait=1):
+            pass
+
+        expect(time.monotonic() - start) >= 0.1
+        expect(breaker.state) == 'closed'
+
+    def it_stops_waiting_at_the_deadline(expect):
+        breaker = helpers.CircuitBreaker('test', 1, 10, 10)
+        _fail(breaker)
+
+        start = time.monotonic()
+        with pytest.raises(exceptions.ServiceUnavailable):
+            with breaker.guard(wait=0.1):
+                pass
+
+        expect(time.monotonic() - start) < 1
+        expect(breaker.state) == 'open'
+
+    def it_shares_state_between_processes(expect):
+        crawler = helpers.CircuitBreaker('test', 1, 10, 10)
+        api = helpers.CircuitBreaker('test', 1, 10, 10)
+        _fail(crawler)
+
+        expect(api.state) == 'open'
+        with pytest.raises(exceptions.ServiceUnavailable):
+            with api.guard():
+                pass
+
+    def it_ignores_errors_that_are_not_service_failures(expect):
+        breaker = helpers.CircuitBreaker('test', 1, 0.01, 0.01)
+        _fail(breaker)
+        time.sleep(0.02)
+
+        with pytest.raises(ValueError):
+            with breaker.guard():
+                raise ValueError()
+
+        expect(breaker.state) == 'half-open'
+
+
+def describe_single_flight():
+    def it_shares_one_call_between_concurrent_callers(expect):
+        flight = helpers.SingleFlight()
+        started = threading.Event()
+        calls = []
+
+        def function():
+            calls.append(1)
+            started.set()
+            time.sleep(0.2)
+            return len(calls)
+
+        with ThreadPoolExecutor() as executor:
+            leader = executor.submit(flight.run, 'key', function)
+            started.wait()
+            followers = [executor.submit(flight.run, 'key', function) for _ in range(3)]
+            results = [f.result() for f in [leader] + followers]
+
+        expect(results) == [1, 1, 1, 1]
+        expect(len(calls)) == 1
+
+    def it_shares_errors_between_concurrent_callers(expect):
+        flight = helpers.SingleFlight()
+        started = threading.Event()
+
+        def function():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError("MVIC is down")
+
+        with ThreadPoolExecutor() as executor:
+            leader = executor.submit(flight.run, 'key', function)
+            started.wait()
+            follower = executor.submit(flight.run, 'key', function)
+
+            with pytest.raises(ValueError):
+                leader.result()
+            with pytest.raises(ValueError):
+                follower.result()
+
+
+def describe_rate_limiter():
+    def it_spaces_out_requests_to_the_same_host(expect):
+        limiter = helpers.RateLimiter(20)
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait("https://mvic.sos.state.mi.us/Voter/Index")
+
+        expect(time.monotonic() - start) >= 0.1
+
+    def it_does_not_wait_without_a_rate(expect):
+        limiter = helpers.RateLimiter()
+
+        start = time.monotonic()
+        for _ in range(3):
+            limiter.wait("https://mvic.sos.state.mi.us/Voter/Index")
+
+        expect(time.monotonic() - start) < 0.1
@@ -1,10 +1,15 @@
 # pylint: disable=unused-variable,unused-argument,expression-not-assigned
 
 
+import io
+
+from django.db import connection
+
 import pendulum
 import pytest
+from requests import Response
 
-from .. import models
+from .. import helpers, models
 
 
 @pytest.fixture
@@ -80,11 +85,64 @@ def describe_district_category():
             expect(str(district_category)) == "County"
 
 
+def describe_reference_manager():
+    def it_reuses_lookups(expect, db, django_assert_num_queries):
+        models.Party.objects.create(name="Democratic")
+        party = models.Party.objects.get_cached(name="Democratic")
+
+        with django_assert_num_queries(0):
+            expect(models.Party.objects.get_cached(name="Democratic")).is_(party)
+
+    def it_is_cleared_on_changes(expect, db):
+        category = models.DistrictCategory.objects.create(name="County")
+        expect(models.DistrictCategory.objects.get_cached(name="County")) == category
+
+        category.delete()
+
+        with pytest.raises(models.DistrictCategory.DoesNotExist):
+            models.DistrictCategory.objects.get_cached(name="County")
+
+
 def describe_district():
     def describe_str():
         def it_includes_the_name(expect, district):
             expect(str(district)) == "Kent"
 
+    def describe_get_or_create_many():
+        @pytest.fixture
+        def categories(db):
+            county = models.DistrictCategory.objects.create(name="County")
+            school = models.DistrictCategory.objects.create(name="School")
+            models.District.objects.create(category=county, name="Kent")
+            models.District.objects.create(category=school, name="Kent")
+            return county, school
+
+        def it_finds_existing_districts(expect, categories):
+            districts = models.District.objects.get_or_create_many({"County": "Kent"})
+
+            expect(districts) == [models.District.objects.get(category__name="County")]
+
+        def it_creates_missing_districts(expect, categories):
+            districts = models.District.objects.get_or_create_many(
+                {"County": "Ottawa", "School": "Kent"}
+            )
+
+            expect([repr(d) for d in districts]) == [
+                "<District: Ottawa (County)>",
+                "<District: Kent (School District)>",
+            ]
+            expect(models.District.objects.count()) == 3
+
+        def it_uses_set_based_queries(expect, categories, django_assert_num_queries):
+            with django_assert_num_queries(2):
+                models.District.objects.get_or_create_many(
+                    {"County": "Kent", "School": "Kent"}
+                )
+
+        def it_rejects_unknown_categories(expect, categories):
+            with pytest.raises(models.DistrictCategory.DoesNotExist):
+                models.District.objects.get_or_create_many({"Galaxy": "Andromeda"})
+
 
 def describe_election():
     def describe_str():
@@ -119,6 +177,68 @@ def describe_ballot_website():
                 website.mvic_url
             ) == "https://mvic.sos.state.mi.us/Voter/GetMvicBallot/1828/676/"
 
+    def describe_mvic_html():
+        def it_is_stored_compressed(expect, db, website):
+            website.mvic_html = "<html>PreviewMvicBallot</html>" * 100
+            website.save()
+
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT LENGTH(mvic_html) FROM elections_ballotwebsite"
+                    " WHERE id = %s",
+                    [website.id],
+                )
+                size = cursor.fetchone()[0]
+            website.refresh_from_db()
+
+            expect(size) < 100
+            expect(website.mvic_html) == "<html>PreviewMvicBallot</html>" * 100
+
+        def it_defaults_to_empty_text(expect, db, website):
+            website.save()
+            website.refresh_from_db()
+
+            expect(website.mvic_html) == ""
+
+    def describe_fetch():
+        @pytest.fixture
+        def requests(monkeypatch):
+            requests = []
+
+            def fetch_ballot(url, *, wait, **headers):
+                response = Response()
+                response.status_code = 304 if headers['etag'] == 'v2' else 200
+                response.raw = io.BytesIO(b"<html>PreviewMvicBallot</html>")
+                response.headers['ETag'] = 'v2'
+                requests.append(headers)
+                return response
+
+            monkeypatch.setattr(helpers, 'fetch_ballot', fetch_ballot)
+            return requests
+
+        def it_reports_changes_to_new_ballots(expect, db, website, requests):
+            expect(website.fetch()) == True
+            expect(website.mvic_html) == "<html>PreviewMvicBallot</html>"
+            expect(website.mvic_etag) == 'v2'
+            expect(requests) == [{'etag': '', 'last_modified': ''}]
+
+        def it_skips_unmodified_ballots(expect, db, website, requests):
+            website.fetch()
+            website.valid = True
+            website.save()
+
+            expect(website.fetch()) == False
+            expect(requests[-1]) == {'etag': 'v2', 'last_modified': ''}
+
+        def it_skips_unchanged_ballots(expect, db, website, requests):
+            website.fetch()
+            website.valid = True
+            website.mvic_etag = ''
+            website.save()
+
+            expect(website.fetch()) == False
+            expect(website.mvic_etag) == 'v2'
+
 
 def describe_ballot():
     def describe_str():
@@ -134,3 +254,51 @@ def describe_position():
             position = models.Position(name="United States Senator", election=election)
             position.update_term()
             expect(position.term) == "6 Year Term"
+
+
+def describe_indexes():
+    @pytest.fixture
+    def explain(db):
+        def explain(queryset) -> str:
+            # Empty test tables are cheaper to scan, so make the planner use indexes
+            with connection.cursor() as cursor:
+                cursor.execute('SET LOCAL enable_seqscan = off')
+            return queryset.explain()
+
+        return explain
+
+    def it_covers_active_elections(expect, explain):
+        plan = explain(models.Election.objects.filter(active=True).order_by('-date'))
+        expect(plan).contains('election_active_date')
+
+    def it_covers_precinct_lookups(expect, explain):
+        plan = explain(
+            models.Precinct.objects.filter(
+                county_id=1, jurisdiction_id=2, ward='1', number='9'
+            )
+        )
+        expect(plan).contains('_uniq')
+
+    def it_covers_district_names(expect, explain):
+        plan = explain(models.District.objects.filter(name="Kent"))
+        expect(plan).contains('district_name')
+
+    @pytest.mark.parametrize('model', [models.Position, models.Proposal])
+    def it_covers_ballot_items_by_precinct(expect, explain, model):
+        label = model.__name__.lower()
+        items = model.precincts.through.objects.filter(precinct_id=1)
+        plan = explain(items.values(f'{label}_id'))
+        expect(plan).contains(f'{label}_precincts_reverse')
+
+    def it_covers_valid_websites(expect, explain):
+        plan = explain(
+            models.BallotWebsite.objects.filter(
+                mvic_election_id=683, valid=True
+            ).order_by('-mvic_precinct_id')
+        )
+        expect(plan).contains('ballotwebsite_valid')
+
+    @pytest.mark.parametrize('model', [models.Position, models.Candidate])
+    def it_covers_keyset_pages(expect, explain, model):
+        plan = explain(model.objects.order_by('name', 'id')[:100])
+        expect(plan).contains(f'{model.__name__.lower()}_name_id')
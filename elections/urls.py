@@ -1,3 +1,5 @@
+from django.urls import path
+
 from rest_framework import routers
 
 from . import views
@@ -23,13 +25,18 @@ router.register('districts', views.DistrictViewSet)
 
 router.register('precincts', views.PrecinctViewSet)
 router.register('ballots', views.BallotViewSet)
+router.register(
+    'ballot-documents', views.BallotDocumentViewSet, basename='ballot-documents'
+)
 
-router.register('proposals', views.ProposalViewSet)
+router.register('proposals', views.ProposalViewSet, basename='proposal')
 
 router.register('parties', views.PartyViewSet)
 router.register('candidates', views.CandidateViewSet)
-router.register('positions', views.PositionViewSet)
+router.register('positions', views.PositionViewSet, basename='position')
 
 router.register('glossary', views.GlossaryViewSet, basename='glossary')
 
-urlpatterns = router.urls
+urlpatterns = [
+    path('registrations/async/', views.registration_status, name='registrations-async')
+] + router.urls
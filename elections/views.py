@@ -1,9 +1,115 @@
-from typing import List, Set
-
+import hashlib
+import json
+import re
+from itertools import islice
+from typing import Dict, Iterator, List, Set, Type
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+from django.utils.text import compress_sequence
+
+from asgiref.sync import sync_to_async
 from rest_framework import generics, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import APIException
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from . import filters, helpers, models, pagination, renderers, serializers
+
+
+ACCEPTS_GZIP = re.compile(r'\bgzip\b')
+
+
+class ConditionalViewSetMixin(viewsets.GenericViewSet):
+    """Let clients revalidate responses, which only change with new data."""
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method not in {'GET', 'HEAD'}:
+            return super().dispatch(request, *args, **kwargs)
+
+        etag = quote_etag(str(helpers.get_data_version()))
+        last_modified = helpers.get_data_modified()
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = super().dispatch(request, *args, **kwargs)
+
+        if response.status_code in {200, 304}:
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+            patch_cache_control(
+                response, public=True, max_age=settings.API_CACHE_MAX_AGE
+            )
+            patch_vary_headers(response, ['Accept'])
+        return response
+
+
+class CachedListMixin(viewsets.GenericViewSet):
+    """Reuse serialized list results until the underlying data changes."""
+
+    def list(self, request, *args, **kwargs):
+        key = self.get_list_cache_key(request)
+
+        data = cache.get(key)
+        hit = data is not None
+        helpers.count_response_cache_lookup(self.basename, hit=hit)
+        if hit:
+            response = Response(data)
+        else:
+            response = super().list(request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, settings.API_RESPONSE_CACHE_TIMEOUT)
+
+        response['X-Cache'] = 'HIT' if hit else 'MISS'
+        return response
+
+    def get_list_cache_key(self, request) -> str:
+        params = sorted(
+            (name, sorted(values))
+            for name, values in request.query_params.lists()
+            if any(values)
+        )
+        # Serializers and renderers can produce different data for the same query
+        variant = [
+            request.accepted_media_type,
+            settings.API_FAST_SERIALIZERS,
+            request.get_host(),
+            request.version,
+        ]
+        digest = hashlib.md5(repr([variant, params]).encode()).hexdigest()
+        version = helpers.get_data_version()
+        return f'responses:{self.basename}:{version}:{digest}'
+
+
+class ValuesListMixin(viewsets.GenericViewSet):
+    """Serialize list results straight from `.values()` rows when enabled."""
 
-from . import filters, models, serializers
+    renderer_classes = [renderers.FastJSONRenderer, BrowsableAPIRenderer]
+    values_serializer_class: Type[serializers.ValuesSerializer]
+
+    def list(self, request, *args, **kwargs):
+        if not settings.API_FAST_SERIALIZERS:
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.values_serializer_class(self.get_serializer_context())
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = queryset.prefetch_related(None).values(*serializer.fields)
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(rows))
 
 
 class RegistrationViewSet(viewsets.ViewSetMixin, generics.ListAPIView):
@@ -21,8 +127,9 @@ class RegistrationViewSet(viewsets.ViewSetMixin, generics.ListAPIView):
         input_serializer = serializers.VoterSerializer(data=request.query_params)
         input_serializer.is_valid(raise_exception=True)
         voter = models.Voter(**input_serializer.validated_data)
+        refresh = _is_refresh(request.query_params)
 
-        registration_status = voter.fetch_registration_status()
+        registration_status = voter.fetch_registration_status(refresh=refresh)
 
         output_serializer = serializers.RegistrationStatusSerializer(
             registration_status, context={'request': request}
@@ -30,7 +137,55 @@ class RegistrationViewSet(viewsets.ViewSetMixin, generics.ListAPIView):
         return Response(output_serializer.data)
 
 
-class ElectionViewSet(viewsets.ModelViewSet):
+async def registration_status(request):
+    """
+    Return the status of a particular voter's registration.
+
+    Unlike `RegistrationViewSet`, this waits on MVIC without holding a worker,
+    so an ASGI server can keep many slow lookups in flight at once.
+    """
+    input_serializer = serializers.VoterSerializer(data=request.GET)
+    try:
+        input_serializer.is_valid(raise_exception=True)
+        voter = models.Voter(**input_serializer.validated_data)
+        refresh = _is_refresh(request.GET)
+
+        data = await helpers.fetch_registration_status_data_async(
+            voter, refresh=refresh
+        )
+    except APIException as e:
+        return _build_error_response(request, e)
+
+    output = await sync_to_async(_serialize_registration_status, thread_sensitive=True)(
+        request, voter, data
+    )
+    return JsonResponse(output)
+
+
+def _build_error_response(request, exc: APIException) -> JsonResponse:
+    """Format an error as DRF's exception handler does for the other views."""
+    handler = api_settings.EXCEPTION_HANDLER
+    response = handler(exc, {'request': request})
+    error_response = JsonResponse(response.data, status=response.status_code)
+    for name, value in response.items():
+        if name != 'Content-Type':
+            error_response[name] = value
+    return error_response
+
+
+def _is_refresh(params) -> bool:
+    return params.get('refresh', '').lower() in {'true', '1'}
+
+
+def _serialize_registration_status(request, voter: models.Voter, data: Dict) -> Dict:
+    registration_status = voter.build_registration_status(data)
+    output_serializer = serializers.RegistrationStatusSerializer(
+        registration_status, context={'request': request}
+    )
+    return output_serializer.data
+
+
+class ElectionViewSet(ConditionalViewSetMixin, viewsets.ModelViewSet):
     """
     [VIP 5.1.2: Election](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/election.html)
 
@@ -47,8 +202,61 @@ class ElectionViewSet(viewsets.ModelViewSet):
     filterset_class = filters.ElectionFilter
     serializer_class = serializers.ElectionSerializer
 
-
-class DistrictCategoryViewSet(viewsets.ModelViewSet):
+    @action(detail=True)
+    def export(self, request, pk=None):  # pylint: disable=unused-argument
+        """
+        Stream every position (with candidates) and proposal in an election
+        as newline-delimited JSON. Send `Accept-Encoding: gzip` to compress it.
+        """
+        election = self.get_object()
+        lines = self.export_lines(election)
+
+        if ACCEPTS_GZIP.search(request.META.get('HTTP_ACCEPT_ENCODING', '')):
+            response = StreamingHttpResponse(
+                compress_sequence(lines), content_type='application/x-ndjson'
+            )
+            response['Content-Encoding'] = 'gzip'
+        else:
+            response = StreamingHttpResponse(lines, content_type='application/x-ndjson')
+
+        patch_vary_headers(response, ['Accept-Encoding'])
+        filename = f'election-{election.id}.ndjson'
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def export_lines(self, election: models.Election) -> Iterator[bytes]:
+        renderer = renderers.FastJSONRenderer()
+        context = self.get_serializer_context()
+        chunk_size = settings.API_EXPORT_CHUNK_SIZE
+
+        for kind, serializer_class, queryset in [
+            (
+                'position',
+                serializers.PositionValuesSerializer,
+                models.Position.objects.filter(election=election),
+            ),
+            (
+                'proposal',
+                serializers.ProposalValuesSerializer,
+                models.Proposal.objects.filter(election=election),
+            ),
+        ]:
+            serializer = serializer_class(context)
+            rows = (
+                queryset.order_by('id')
+                .values(*serializer.fields)
+                .iterator(chunk_size=chunk_size)
+            )
+            while True:
+                # Each chunk's candidates are loaded in one query as it streams
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                for data in serializer.to_representation(chunk):
+                    yield renderer.render({'type': kind, 'data': data}) + b'\n'
+
+
+class DistrictCategoryViewSet(ConditionalViewSetMixin, viewsets.ModelViewSet):
     """
     [VIP 5.1.2: DistrictType](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/enumerations/district_type.html)
 
@@ -64,7 +272,7 @@ class DistrictCategoryViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.DistrictCategorySerializer
 
 
-class DistrictViewSet(viewsets.ModelViewSet):
+class DistrictViewSet(ConditionalViewSetMixin, viewsets.ModelViewSet):
     """
     [VIP 5.1.2: Locality](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/locality.html)
 
@@ -76,11 +284,13 @@ class DistrictViewSet(viewsets.ModelViewSet):
     """
 
     http_method_names = ['options', 'get']
-    queryset = models.District.objects.all().prefetch_related('category')
+    queryset = models.District.objects.select_related('category').all()
     serializer_class = serializers.DistrictSerializer
+    pagination_class = pagination.KeysetPagination
+    cursor_ordering = ('id',)
 
 
-class PrecinctViewSet(viewsets.ModelViewSet):
+class PrecinctViewSet(ConditionalViewSetMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     [VIP 5.1.2: Precinct](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/precinct.html)
 
@@ -96,9 +306,12 @@ class PrecinctViewSet(viewsets.ModelViewSet):
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = filters.PrecinctFilter
     serializer_class = serializers.PrecinctSerializer
+    pagination_class = pagination.KeysetPagination
+    cursor_ordering = ('id',)
+    values_serializer_class = serializers.PrecinctValuesSerializer
 
 
-class BallotViewSet(viewsets.ModelViewSet):
+class BallotViewSet(ConditionalViewSetMixin, viewsets.ModelViewSet):
     """
     [VIP 5.1.2: BallotStyle](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/ballot_style.html)
 
@@ -111,14 +324,63 @@ class BallotViewSet(viewsets.ModelViewSet):
 
     http_method_names = ['options', 'get']
     queryset = models.Ballot.objects.select_related(
-        'election', 'precinct', 'precinct__county', 'precinct__jurisdiction'
-    ).all()
+        'election',
+        'precinct__county',
+        'precinct__jurisdiction',
+        'website',
+    ).defer('website__mvic_html', 'website__data')
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = filters.BallotFilter
     serializer_class = serializers.BallotSerializer
+    pagination_class = pagination.KeysetPagination
+    cursor_ordering = ('id',)
+
+
+class BallotDocumentViewSet(viewsets.ViewSet):
+    """
+    list:
+    Return a ballot with all of its positions and proposals in one response.
+    """
 
+    http_method_names = ['get']
+    filter_backends = [filters.DjangoFilterBackend]
+    filterset_class = filters.BallotDocumentFilter
+    queryset = models.BallotDocument.objects.all()
 
-class ProposalViewSet(viewsets.ModelViewSet):
+    def list(self, request):
+        filterset = self.filterset_class(request.query_params, self.queryset.all())
+        if not filterset.is_valid():
+            return Response(filterset.errors, status=400)
+
+        document = generics.get_object_or_404(
+            filterset.qs.only(
+                'election', 'precinct', 'content', 'etag', 'data_version', 'modified'
+            )
+        )
+        try:
+            document = models.BallotDocument.objects.refresh(document)
+        except models.Ballot.DoesNotExist:
+            raise Http404 from None
+        etag = quote_etag(document.etag)
+        last_modified = int(document.modified.timestamp())
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            # Documents are stored with relative URLs to be independent of the host
+            base_url = request.build_absolute_uri('/')
+            content = document.content.replace('"url": "/', f'"url": "{base_url}')
+            response = Response(json.loads(content))
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
+
+
+class ProposalViewSet(
+    ConditionalViewSetMixin, CachedListMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """
     [VIP 5.1.2: BallotMeasureContest](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/ballot_measure_contest.html)
 
@@ -130,17 +392,16 @@ class ProposalViewSet(viewsets.ModelViewSet):
     """
 
     http_method_names = ['get']
-    queryset = (
-        models.Proposal.objects.select_related('election', 'district__category')
-        .order_by('district__category__rank', 'name')
-        .distinct()
-    )
+    queryset = models.Proposal.objects.select_related(
+        'election', 'district__category'
+    ).order_by('district__category__rank', 'name')
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = filters.ProposalFilter
     serializer_class = serializers.ProposalSerializer
+    values_serializer_class = serializers.ProposalValuesSerializer
 
 
-class PartyViewSet(viewsets.ModelViewSet):
+class PartyViewSet(ConditionalViewSetMixin, viewsets.ModelViewSet):
     """
     [VIP 5.1.2: Party](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/party.html)
 
@@ -156,7 +417,7 @@ class PartyViewSet(viewsets.ModelViewSet):
     serializer_class = serializers.PartySerializer
 
 
-class CandidateViewSet(viewsets.ModelViewSet):
+class CandidateViewSet(ConditionalViewSetMixin, ValuesListMixin, viewsets.ModelViewSet):
     """
     [VIP 5.1.2: Candidate](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/candidate.html)
 
@@ -173,9 +434,14 @@ class CandidateViewSet(viewsets.ModelViewSet):
     # filter_backends = [filters.DjangoFilterBackend]
     # filterset_class = filters.CandidateFilter
     serializer_class = serializers.CandidateSerializer
+    pagination_class = pagination.KeysetPagination
+    cursor_ordering = ('name', 'id')
+    values_serializer_class = serializers.CandidateValuesSerializer
 
 
-class PositionViewSet(viewsets.ModelViewSet):
+class PositionViewSet(
+    ConditionalViewSetMixin, CachedListMixin, ValuesListMixin, viewsets.ModelViewSet
+):
     """
     [VIP 5.1.2: CandidateContest](https://vip-specification.readthedocs.io/en/vip52/built_rst/xml/elements/candidate_contest.html)
 
@@ -191,11 +457,13 @@ class PositionViewSet(viewsets.ModelViewSet):
         models.Position.objects.select_related('election', 'district__category')
         .prefetch_related('candidates__party')
         .order_by('district__category__rank', 'name')
-        .distinct()
     )
     filter_backends = [filters.DjangoFilterBackend]
     filterset_class = filters.PositionFilter
     serializer_class = serializers.PositionSerializer
+    pagination_class = pagination.KeysetPagination
+    cursor_ordering = ('name', 'id')
+    values_serializer_class = serializers.PositionValuesSerializer
 
     def get_queryset(self):
         section = self.request.query_params.get('section')
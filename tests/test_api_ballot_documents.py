@@ -0,0 +1,96 @@
+# pylint: disable=unused-argument,unused-variable
+
+import pytest
+
+from elections import helpers
+from elections.models import BallotDocument, Position
+
+from . import factories
+
+
+@pytest.fixture
+def ballot(db):
+    ballot = factories.BallotFactory.create()
+    position = factories.PositionFactory.create(election=ballot.election)
+    position.precincts.add(ballot.precinct)
+    BallotDocument.objects.materialize(ballot)
+    return ballot
+
+
+def describe_list():
+    @pytest.fixture
+    def url(ballot):
+        return (
+            '/api/ballot-documents/'
+            f'?election_id={ballot.election.id}&precinct_id={ballot.precinct.id}'
+        )
+
+    def it_returns_the_ballot_with_its_items(expect, client, url, ballot):
+        response = client.get(url)
+
+        expect(response.status_code) == 200
+        data = response.json()
+        expect(data['id']) == ballot.id
+        expect(data['url']) == f'http://testserver/api/ballots/{ballot.id}/'
+        expect(len(data['positions'])) == 1
+        expect(data['positions'][0]['election']['url']) == (
+            f'http://testserver/api/elections/{ballot.election.id}/'
+        )
+        expect(data['proposals']) == []
+
+    def it_supports_conditional_requests(expect, client, url):
+        response = client.get(url)
+        etag = response['ETag']
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 304
+        expect(response['ETag']) == etag
+
+    def it_keeps_validators_when_other_data_changes(expect, client, url):
+        etag = client.get(url)['ETag']
+        helpers.bump_data_version()
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 304
+
+    def it_reflects_position_edits(expect, client, url, ballot):
+        etag = client.get(url)['ETag']
+        position = Position.objects.get()
+        position.description = "Leads the executive branch of the city."
+        position.save()
+        helpers.bump_data_version()
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 200
+        expect(response['ETag']) != etag
+        expect(response.json()['positions'][0]['description']) == (
+            "Leads the executive branch of the city."
+        )
+
+    def it_reflects_election_edits(expect, client, url, ballot):
+        etag = client.get(url)['ETag']
+        ballot.election.active = False
+        ballot.election.save()
+        helpers.bump_data_version()
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 200
+        expect(response.json()['election']['active']) == False
+
+    def it_requires_an_election_and_precinct(expect, client, ballot):
+        response = client.get(
+            f'/api/ballot-documents/?election_id={ballot.election.id}'
+        )
+
+        expect(response.status_code) == 400
+
+    def it_handles_unparsed_ballots(expect, client, ballot):
+        response = client.get(
+            f'/api/ballot-documents/?election_id={ballot.election.id}&precinct_id=0'
+        )
+
+        expect(response.status_code) == 404
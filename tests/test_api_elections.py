@@ -1,8 +1,17 @@
 # pylint: disable=unused-argument,unused-variable
 
+import gzip
+import json
+import time
+
+from django.utils.http import parse_http_date
+
 import pendulum
 import pytest
 
+from elections import helpers
+from elections.models import Candidate, Election, Proposal
+
 from . import factories
 
 
@@ -30,3 +39,114 @@ def describe_list():
 
         expect(response.status_code) == 200
         expect(response.data['count']) == 2
+
+
+def describe_caching():
+    @pytest.fixture
+    def url():
+        return '/api/elections/'
+
+    def it_includes_validators(expect, client, url, elections):
+        response = client.get(url)
+
+        expect(response.status_code) == 200
+        expect(response['ETag']) == f'"{helpers.get_data_version()}"'
+        expect(response['Cache-Control']).contains('max-age=')
+        expect(response.has_header('Last-Modified')) == True
+
+    def it_skips_unchanged_responses(expect, client, url, elections):
+        etag = client.get(url)['ETag']
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 304
+        expect(response.content) == b''
+
+    def it_revalidates_after_new_data(expect, client, url, elections):
+        etag = client.get(url)['ETag']
+        helpers.bump_data_version()
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 200
+        expect(response['ETag']) != etag
+
+    def it_never_reports_modifications_in_the_future(expect, client, url, elections):
+        for _ in range(3):
+            helpers.bump_data_version()
+
+        response = client.get(url)
+
+        expect(parse_http_date(response['Last-Modified'])) <= time.time()
+
+    def it_waits_for_the_write_batch_to_finish(expect, client, url, elections):
+        etag = client.get(url)['ETag']
+        election = Election.objects.first()
+        election.name = "Special Election"
+        election.save()
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 304
+
+    @pytest.mark.django_db(transaction=True)
+    def it_revalidates_after_admin_edits(expect, client, admin_client, url, elections):
+        etag = client.get(url)['ETag']
+        election = Election.objects.first()
+
+        response = admin_client.post(
+            f'/admin/elections/election/{election.id}/change/',
+            {
+                'name': "Special Election",
+                'date': election.date,
+                'description': "",
+                'active': 'on',
+                'reference_url': "",
+                'mvic_id': election.mvic_id,
+            },
+        )
+        expect(response.status_code) == 302
+
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        expect(response.status_code) == 200
+        expect(response['ETag']) != etag
+
+
+def describe_export():
+    @pytest.fixture
+    def election(db):
+        position = factories.PositionFactory.create(name="Mayor")
+        for name in ["Jane Doe", "John Doe"]:
+            Candidate.objects.create(position=position, name=name)
+        Proposal.objects.create(election=position.election, name="Library Millage")
+        return position.election
+
+    @pytest.fixture
+    def url(election):
+        return f'/api/elections/{election.id}/export/'
+
+    def it_streams_ballot_items_as_json_lines(expect, client, url, election):
+        response = client.get(url)
+
+        expect(response.status_code) == 200
+        expect(response['Content-Type']) == 'application/x-ndjson'
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        records = [json.loads(line) for line in lines]
+        expect([r['type'] for r in records]) == ['position', 'proposal']
+        expect(records[0]['data']['name']) == "Mayor"
+        expect(len(records[0]['data']['candidates'])) == 2
+        expect(records[1]['data']['election']['id']) == election.id
+
+    def it_can_be_compressed(expect, client, url, election):
+        response = client.get(url, HTTP_ACCEPT_ENCODING='gzip')
+
+        expect(response.status_code) == 200
+        expect(response['Content-Encoding']) == 'gzip'
+        content = gzip.decompress(b''.join(response.streaming_content))
+        expect(len(content.splitlines())) == 2
+
+    def it_handles_unknown_elections(expect, client, db):
+        response = client.get('/api/elections/0/export/')
+
+        expect(response.status_code) == 404
@@ -2,6 +2,9 @@
 
 import pytest
 
+from elections import helpers
+from elections.models import BallotItemIndex
+
 from . import factories
 
 
@@ -36,3 +39,80 @@ def describe_list():
 
         expect(response.status_code) == 200
         expect(len(response.data['results'])) == 2
+
+
+def describe_precinct_filters():
+    @pytest.fixture
+    def position(db):
+        position = factories.PositionFactory.create()
+        first = factories.PrecinctFactory.create(
+            county__name="Kent", jurisdiction__name="Grand Rapids", ward='1', number='1'
+        )
+        second = factories.PrecinctFactory.create(
+            county=first.county, jurisdiction=first.jurisdiction, ward='2', number='2'
+        )
+        for precinct in [first, second]:
+            ballot = factories.BallotFactory.create(
+                election=position.election, precinct=precinct, website=None
+            )
+            BallotItemIndex.objects.update_ballot(
+                ballot, positions={position.id}, proposals=set()
+            )
+        return position
+
+    def it_lists_items_on_several_matching_precincts_once(expect, client, position):
+        response = client.get('/api/positions/?precinct_county=Kent')
+
+        expect(response.status_code) == 200
+        expect(response.data['count']) == 1
+
+    def it_requires_all_filters_to_match_the_same_precinct(expect, client, position):
+        response = client.get('/api/positions/?precinct_ward=2&precinct_number=2')
+        expect(response.data['count']) == 1
+
+        response = client.get('/api/positions/?precinct_ward=1&precinct_number=2')
+        expect(response.data['count']) == 0
+
+
+def describe_caching():
+    @pytest.fixture
+    def url():
+        return '/api/positions/'
+
+    def it_reuses_results_for_equivalent_filters(
+        expect, client, url, positions, django_assert_num_queries
+    ):
+        response = client.get(url + '?section=Democratic&active_election=true')
+        expect(response['X-Cache']) == 'MISS'
+
+        with django_assert_num_queries(0):
+            response = client.get(url + '?active_election=true&section=Democratic')
+
+        expect(response['X-Cache']) == 'HIT'
+        expect(len(response.data['results'])) == 2
+        expect(helpers.get_response_cache_stats('position')) == (1, 1)
+
+    def it_is_invalidated_by_new_data(expect, client, url, positions):
+        client.get(url)
+        helpers.bump_data_version()
+
+        response = client.get(url)
+
+        expect(response['X-Cache']) == 'MISS'
+
+    def it_separates_rendered_formats(expect, client, url, positions):
+        client.get(url, HTTP_ACCEPT='application/json')
+
+        response = client.get(url, HTTP_ACCEPT='text/html')
+
+        expect(response['X-Cache']) == 'MISS'
+        expect(response['Content-Type']).contains('text/html')
+
+    def it_separates_serializer_modes(expect, client, url, positions, settings):
+        settings.API_FAST_SERIALIZERS = True
+        client.get(url)
+
+        settings.API_FAST_SERIALIZERS = False
+        response = client.get(url)
+
+        expect(response['X-Cache']) == 'MISS'
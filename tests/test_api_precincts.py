@@ -1,5 +1,7 @@
 # pylint: disable=unused-argument,unused-variable
 
+from typing import List
+
 import pytest
 
 from . import factories
@@ -35,3 +37,50 @@ def describe_detail():
             'ward': None,
             'number': '3',
         }
+
+
+def describe_list():
+    @pytest.fixture
+    def precincts(precinct):
+        for number in ['4', '5', '6', '7']:
+            factories.PrecinctFactory.create(
+                county=precinct.county,
+                jurisdiction=precinct.jurisdiction,
+                ward='',
+                number=number,
+            )
+
+    def it_counts_results_by_default(expect, client, precincts):
+        response = client.get('/api/precincts/?limit=2&offset=2')
+
+        expect(response.status_code) == 200
+        expect(response.data['count']) == 5
+        expect(len(response.data['results'])) == 2
+
+    def it_can_skip_counting(expect, client, precincts, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = client.get('/api/precincts/?limit=2&offset=2&count=false')
+
+        expect(response.status_code) == 200
+        expect(response.data['count']) == None
+        expect(response.data['next']).contains('offset=4')
+        expect(response.data['previous']).contains('limit=2')
+
+    def it_can_page_by_cursor(expect, client, precincts, django_assert_num_queries):
+        numbers: List[str] = []
+        url = '/api/precincts/?limit=2&cursor='
+        while url:
+            with django_assert_num_queries(1):
+                response = client.get(url)
+            expect(response.status_code) == 200
+            expect(response.data['count']) == None
+            expect(response.data['previous']) == None
+            numbers.extend(p['number'] for p in response.data['results'])
+            url = response.data['next']
+
+        expect(numbers) == ['3', '4', '5', '6', '7']
+
+    def it_rejects_invalid_cursors(expect, client, precincts):
+        response = client.get('/api/precincts/?cursor=invalid')
+
+        expect(response.status_code) == 404
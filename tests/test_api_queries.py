@@ -0,0 +1,124 @@
+# pylint: disable=unused-argument,unused-variable
+
+import json
+
+from django.test import override_settings
+
+import pytest
+
+from elections.models import (
+    Ballot,
+    BallotWebsite,
+    Candidate,
+    District,
+    DistrictCategory,
+    Party,
+    Position,
+    Precinct,
+    Proposal,
+)
+
+from . import factories
+
+
+@pytest.fixture
+def data(db):
+    election = factories.ElectionFactory.create()
+    county_category = DistrictCategory.objects.create(name="County")
+    jurisdiction_category = DistrictCategory.objects.create(name="Jurisdiction")
+    party = Party.objects.create(name="Democratic")
+
+    for index in range(5):
+        county = District.objects.create(
+            category=county_category, name=f"County {index}"
+        )
+        jurisdiction = District.objects.create(
+            category=jurisdiction_category, name=f"City {index}"
+        )
+        precinct = Precinct.objects.create(
+            county=county, jurisdiction=jurisdiction, number=str(index + 1)
+        )
+        website = BallotWebsite.objects.create(
+            mvic_election_id=election.mvic_id, mvic_precinct_id=index + 1
+        )
+        Ballot.objects.create(election=election, precinct=precinct, website=website)
+
+        position = Position.objects.create(
+            election=election,
+            district=county,
+            name=f"Position {index}",
+            description="Serves a four-year term\u2028in Équipe County",
+        )
+        position.precincts.add(precinct)
+        for name in ["Jane", "John"]:
+            Candidate.objects.create(
+                position=position,
+                name=f"{name} {index}",
+                party=party if name == "Jane" else None,
+            )
+
+        proposal = Proposal.objects.create(
+            election=election, district=jurisdiction, name=f"Proposal {index}"
+        )
+        proposal.precincts.add(precinct)
+
+
+@pytest.mark.parametrize(
+    ('path', 'fast_count', 'model_count'),
+    [
+        ('elections', 2, 2),
+        ('district-categories', 2, 2),
+        ('districts', 2, 2),
+        ('precincts', 2, 2),
+        ('ballots', 2, 2),
+        ('proposals', 2, 2),
+        ('parties', 2, 2),
+        ('candidates', 2, 2),
+        # Model serializers prefetch parties instead of using the reference cache
+        ('positions', 3, 4),
+        ('glossary', 3, 3),
+    ],
+)
+@pytest.mark.parametrize('fast', [True, False])
+def test_list_query_counts(
+    expect,
+    client,
+    data,
+    django_assert_num_queries,
+    path,
+    fast_count,
+    model_count,
+    fast,
+):
+    with override_settings(API_FAST_SERIALIZERS=fast):
+        with django_assert_num_queries(fast_count if fast else model_count):
+            response = client.get(f'/api/{path}/?limit=100')
+
+    expect(response.status_code) == 200
+
+
+@pytest.mark.parametrize(
+    'url',
+    [
+        '/api/precincts/?limit=100',
+        '/api/precincts/?county=County 1',
+        '/api/candidates/?limit=100',
+        '/api/candidates/?party=Democratic',
+        '/api/proposals/?limit=100',
+        '/api/proposals/?limit=2&offset=2',
+        '/api/positions/?limit=100',
+        '/api/positions/?limit=2&offset=2',
+    ],
+)
+def test_fast_serializers_match_model_serializers(expect, client, data, url):
+    with override_settings(API_FAST_SERIALIZERS=False):
+        response = client.get(url)
+    expect(response.status_code) == 200
+    content = response.content
+
+    with override_settings(API_FAST_SERIALIZERS=True):
+        response = client.get(url)
+    expect(response.status_code) == 200
+
+    expect(response.content) == content
+    expect(json.loads(response.content)['results']) != []
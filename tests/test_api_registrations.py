@@ -1,8 +1,10 @@
 # pylint: disable=unused-argument,unused-variable
 
+from typing import Dict, List, Union
+
 import pytest
 
-from elections import defaults
+from elections import defaults, exceptions, helpers
 
 
 def describe_list():
@@ -129,6 +131,43 @@ def describe_list():
             ],
         }
 
+    def it_stays_within_a_query_budget(
+        expect, client, url, db, monkeypatch, django_assert_max_num_queries
+    ):
+        defaults.initialize_districts()
+        data = {
+            "registered": True,
+            "absentee": False,
+            "absentee_dates": {
+                'Application Received': None,
+                'Ballot Sent': None,
+                'Ballot Received': None,
+            },
+            "districts": {
+                "County": "Kent County",
+                "Jurisdiction": "City of Grand Rapids",
+                "School": "Grand Rapids Public Schools",
+                "State House": "75th District",
+                "State Senate": "29th District",
+                "US Congress": "3rd District",
+                "Precinct": "30",
+                "Ward": "2",
+            },
+            "polling_location": {},
+            "dropbox_location": None,
+            "recently_moved": False,
+        }
+        monkeypatch.setattr(
+            helpers, 'fetch_registration_status_data', lambda *_, **__: data
+        )
+        url += '?first_name=Jane&last_name=Doe&birth_date=2000-01-01&zip_code=49503'
+
+        with django_assert_max_num_queries(10):
+            expect(client.get(url).status_code) == 200
+
+        with django_assert_max_num_queries(3):
+            expect(client.get(url).status_code) == 200
+
     @pytest.mark.vcr
     def it_handles_unknown_voters(expect, client, url):
         response = client.get(
@@ -151,3 +190,105 @@ def describe_list():
             'precinct': None,
             'districts': [],
         }
+
+
+def describe_async_list():
+    @pytest.fixture
+    def url():
+        return '/api/registrations/async/'
+
+    @pytest.fixture
+    def mvic(monkeypatch):
+        responses: List[Union[Dict, Exception]] = []
+
+        async def fetch(voter, *, refresh):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        monkeypatch.setattr(helpers, 'fetch_registration_status_data_async', fetch)
+        return responses
+
+    def it_handles_unknown_voters(expect, client, url, mvic):
+        mvic.append({"registered": False})
+
+        response = client.get(
+            url + '?first_name=Jane'
+            '&last_name=Doe'
+            '&birth_date=2000-01-01'
+            '&zip_code=999999'
+        )
+
+        expect(response.status_code) == 200
+        expect(response.json()) == {
+            'registered': False,
+            'absentee': False,
+            'absentee_application_received': None,
+            'absentee_ballot_sent': None,
+            'absentee_ballot_received': None,
+            'polling_location': None,
+            'dropbox_location': None,
+            'recently_moved': False,
+            'precinct': None,
+            'districts': [],
+        }
+
+    def it_requires_voter_information(expect, client, url, mvic):
+        response = client.get(url + '?first_name=Jane')
+
+        expect(response.status_code) == 400
+        expect(response.json()).contains('last_name')
+
+    def it_reports_mvic_outages(expect, client, url, mvic):
+        mvic.append(exceptions.ServiceUnavailable())
+
+        response = client.get(
+            url + '?first_name=Jane'
+            '&last_name=Doe'
+            '&birth_date=2000-01-01'
+            '&zip_code=999999'
+        )
+
+        expect(response.status_code) == 503
+
+
+def describe_async_errors():
+    @pytest.fixture
+    def outage(monkeypatch):
+        def fetch(voter, *, refresh):
+            raise exceptions.ServiceUnavailable()
+
+        async def fetch_async(voter, *, refresh):
+            raise exceptions.ServiceUnavailable()
+
+        monkeypatch.setattr(helpers, 'fetch_registration_status_data', fetch)
+        monkeypatch.setattr(
+            helpers, 'fetch_registration_status_data_async', fetch_async
+        )
+
+    @pytest.mark.parametrize(
+        'query',
+        [
+            '',
+            '?first_name=Jane',
+            '?first_name=Jane&last_name=Doe&birth_date=unknown&zip_code=49503',
+        ],
+    )
+    def it_matches_the_viewset_on_invalid_input(expect, client, db, query):
+        response = client.get('/api/registrations/' + query)
+        async_response = client.get('/api/registrations/async/' + query)
+
+        expect(response.status_code) == 400
+        expect(async_response.status_code) == 400
+        expect(async_response.json()) == response.json()
+
+    def it_matches_the_viewset_on_mvic_outages(expect, client, db, outage):
+        query = '?first_name=Jane&last_name=Doe&birth_date=2000-01-01&zip_code=49503'
+
+        response = client.get('/api/registrations/' + query)
+        async_response = client.get('/api/registrations/async/' + query)
+
+        expect(response.status_code) == 503
+        expect(async_response.status_code) == 503
+        expect(async_response.json()) == response.json()
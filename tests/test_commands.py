@@ -1,6 +1,11 @@
 # pylint: disable=unused-argument,unused-variable
 
 
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 import pendulum
 import pytest
 
@@ -69,3 +74,112 @@ def describe_parse_ballots():
 
         expect(Ballot.objects.count()) == 1
         expect(District.objects.count()) == 7
+
+    def with_multiple_workers():
+        @pytest.fixture
+        def vcr_cassette_name():
+            return 'with_active_election_and_one_scrapped_ballot'
+
+        @pytest.mark.vcr
+        @pytest.mark.django_db(transaction=True)
+        def it_parses_precincts_in_separate_processes(expect, active_election):
+            defaults.initialize_districts()
+            defaults.initialize_parties()
+
+            commands.scrape_ballots(starting_precinct_id=1828, ballot_limit=1)
+            website = BallotWebsite.objects.get()
+            website.scrape()
+            website.pk = None
+            website.mvic_precinct_id += 1
+            website.data['precinct'][-1] += '0'
+            website.save()
+
+            commands.parse_ballots(workers=2)
+
+            expect(Ballot.objects.count()) == 2
+            expect(Ballot.objects.filter(website__last_parse=None).count()) == 0
+
+
+def describe_parse_ballots_concurrently():
+    @pytest.fixture
+    def websites(active_election):
+        precincts = [
+            ["Kent", "City of Grand Rapids", "1", "1"],
+            ["Kent", "City of Grand Rapids", "1", "2"],
+            ["Kent", "City of Grand Rapids", "1", "1"],
+            ["Kent", "City of Walker", "", "3"],
+            ["Kent", "City of Walker", "0", "3"],
+        ]
+        for index, precinct in enumerate(precincts, start=1):
+            BallotWebsite.objects.create(
+                mvic_election_id=682,
+                mvic_precinct_id=index,
+                data={'precinct': precinct},
+                valid=True,
+            )
+        return list(
+            BallotWebsite.objects.order_by('mvic_precinct_id').values_list(
+                'id', flat=True
+            )
+        )
+
+    @pytest.fixture
+    def shards(monkeypatch):
+        shards: List[List[int]] = []
+
+        def fake_parse_websites(website_ids, incremental):
+            shards.append(sorted(website_ids))
+            return 0
+
+        monkeypatch.setattr(commands, 'ProcessPoolExecutor', ThreadPoolExecutor)
+        monkeypatch.setattr(commands, '_parse_websites', fake_parse_websites)
+        return shards
+
+    def it_keeps_duplicate_precincts_together(expect, websites, shards):
+        commands.parse_ballots(workers=2)
+
+        ids = websites
+        expect(sorted(shards)) == [[ids[0], ids[2]], [ids[1], ids[3], ids[4]]]
+
+    def it_limits_workers_to_the_number_of_precincts(expect, websites, shards):
+        commands.parse_ballots(workers=8)
+
+        expect(len(shards)) == 3
+
+
+def describe_scrape_ballots_concurrently():
+    @pytest.fixture
+    def scraped(db, monkeypatch):
+        precinct_ids: List[int] = []
+
+        def fake_scrape_ballot(election_id, precinct_id, limit, limiter):
+            time.sleep(random.random() / 100)
+            if election_id != 1:
+                return False
+            precinct_ids.append(precinct_id)
+            return precinct_id < 10 or precinct_id == 12
+
+        monkeypatch.setattr(commands, '_scrape_ballot', fake_scrape_ballot)
+        return precinct_ids
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def it_stops_after_consecutive_errors(expect, scraped, workers):
+        commands.scrape_ballots(
+            starting_election_id=1,
+            max_election_error_count=1,
+            max_ballot_error_count=3,
+            workers=workers,
+        )
+
+        expect(sorted(scraped)) == list(range(1, 16))
+
+    @pytest.mark.parametrize('workers', [1, 4])
+    def it_stops_after_the_limit(expect, scraped, workers):
+        commands.scrape_ballots(
+            starting_election_id=1,
+            ballot_limit=5,
+            max_ballot_error_count=3,
+            workers=workers,
+        )
+
+        expect(sorted(scraped)) == list(range(1, 6))
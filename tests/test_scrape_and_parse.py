@@ -1,10 +1,36 @@
 # pylint: disable=unused-argument,unused-variable
 
 
+import hashlib
+import json
+import re
+from pathlib import Path
+
 import pytest
 
-from elections import defaults
-from elections.models import BallotWebsite, Candidate, Position, Proposal
+from elections import defaults, helpers
+from elections.models import (
+    Ballot,
+    BallotDocument,
+    BallotItemIndex,
+    BallotWebsite,
+    Candidate,
+    Position,
+    Proposal,
+)
+
+
+BALLOT_ELECTIONS = {
+    'test_2020_primary_ballots': 682,
+    'test_2020_general_ballots': 683,
+    'test_2021_consolidated_ballots': 685,
+    'test_2021_primary_ballots': 686,
+}
+
+BALLOT_CASSETTES = sorted(
+    path.stem
+    for path in (Path(__file__).parent / 'cassettes').glob('test_20*_ballots*.yaml')
+)
 
 
 def parse_ballot(election_id: int, precinct_id: int) -> int:
@@ -144,3 +170,116 @@ def test_capitalization(expect, db):
     parse_ballot(683, 1828)
     expect(Position.objects.filter(name__contains="of The").count()) == 0
     expect(Position.objects.filter(name__contains="of the").count()) == 3
+
+
+def describe_scrape():
+    @pytest.fixture(params=BALLOT_CASSETTES)
+    def vcr_cassette_name(request):
+        return request.param
+
+    @pytest.mark.vcr
+    def it_matches_with_lxml(expect, db, monkeypatch, vcr_cassette_name):
+        match = re.fullmatch(r'(\w+)\[(\d+)-\d+\]', vcr_cassette_name)
+        assert match, f'Unexpected cassette name: {vcr_cassette_name}'
+        website = BallotWebsite.objects.create(
+            mvic_election_id=BALLOT_ELECTIONS[match[1]],
+            mvic_precinct_id=int(match[2]),
+        )
+        website.fetch()
+        website.validate()
+
+        monkeypatch.setattr(helpers, 'SOUP_FEATURES', 'html.parser')
+        website.scrape()
+        data = website.data
+
+        monkeypatch.setattr(helpers, 'SOUP_FEATURES', 'lxml')
+        website.scrape()
+        expect(website.data) == data
+
+
+def describe_incremental_parse():
+    @pytest.fixture
+    def vcr_cassette_name():
+        return 'test_reference_url'
+
+    @pytest.fixture
+    def ballot(db):
+        defaults.initialize_districts()
+        defaults.initialize_parties()
+
+        website = BallotWebsite.objects.create(
+            mvic_election_id=683, mvic_precinct_id=1828
+        )
+        website.fetch()
+        website.validate()
+        website.scrape()
+
+        ballot = website.convert()
+        ballot.website = website
+        ballot.parse()
+        return ballot
+
+    @pytest.mark.vcr
+    def it_skips_unchanged_divisions(expect, ballot, django_assert_max_num_queries):
+        count = ballot.parse()
+
+        # Checking that the ballot's document exists takes one more query
+        with django_assert_max_num_queries(6):
+            expect(ballot.parse(incremental=True)) == count
+
+    @pytest.mark.vcr
+    def it_saves_items_in_bulk(expect, ballot, django_assert_max_num_queries):
+        with django_assert_max_num_queries(25):
+            expect(ballot.parse()) > 0
+
+    @pytest.mark.vcr
+    def it_removes_precinct_from_deleted_items(expect, ballot):
+        count = ballot.parse()
+        proposals = Proposal.objects.filter(precincts=ballot.precinct)
+        removed = proposals.count()
+        del ballot.website.data['ballot']['proposal section']
+
+        expect(ballot.parse(incremental=True)) == count - removed
+        expect(proposals.count()) == 0
+        expect(BallotItemIndex.objects.filter(item_type='proposal').count()) == 0
+        expect(json.loads(BallotDocument.objects.get().content)['proposals']) == []
+
+
+def describe_parse():
+    @pytest.fixture
+    def vcr_cassette_name():
+        return 'test_proposal_description_general'
+
+    @pytest.mark.vcr
+    def it_materializes_the_ballot_document(expect, db):
+        parse_ballot(683, 1828)
+
+        document = BallotDocument.objects.get()
+        data = json.loads(document.content)
+        expect(len(data['positions'])) == Position.objects.count()
+        expect(data['proposals'][0]['url']).startswith('/api/proposals/')
+        expect(document.etag) == hashlib.sha1(document.content.encode()).hexdigest()
+
+    @pytest.mark.vcr
+    def it_indexes_ballot_items_by_precinct(expect, client, db):
+        parse_ballot(683, 1828)
+
+        precinct = Ballot.objects.get().precinct
+        index = BallotItemIndex.objects.filter(precinct=precinct)
+        expect(index.filter(item_type='position').count()) == Position.objects.count()
+        expect(index.filter(item_type='proposal').count()) == Proposal.objects.count()
+
+        response = client.get(
+            '/api/positions/',
+            {
+                'limit': 1000,
+                'precinct_county': precinct.county.name,
+                'precinct_jurisdiction': precinct.jurisdiction.name,
+                'precinct_ward': precinct.ward,
+                'precinct_number': precinct.number,
+            },
+        )
+        expect(response.data['count']) == Position.objects.count()
+
+        response = client.get(f'/api/proposals/?precinct_id={precinct.id + 1}')
+        expect(response.data['count']) == 0